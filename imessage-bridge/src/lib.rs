@@ -7,7 +7,8 @@ use imessage_database::{
     },
     util::dirs::default_db_path,
 };
-use rusqlite::{Connection, OpenFlags, OptionalExtension};
+use rusqlite::{params_from_iter, Connection, OpenFlags, OptionalExtension};
+use std::collections::{HashMap, VecDeque};
 use std::path::PathBuf;
 use serde::{Serialize, Deserialize};
 
@@ -85,6 +86,235 @@ struct PyAttachment {
     total_bytes: Option<i64>,
 }
 
+#[pymethods]
+impl PyMessage {
+    /// Return all fields as a dict in a single call, avoiding one attribute
+    /// lookup per field on the Python side
+    fn to_dict(&self, py: Python) -> PyResult<PyObject> {
+        let dict = PyDict::new(py);
+        dict.set_item("rowid", self.rowid)?;
+        dict.set_item("guid", &self.guid)?;
+        dict.set_item("text", &self.text)?;
+        dict.set_item("service", &self.service)?;
+        dict.set_item("handle_id", self.handle_id)?;
+        dict.set_item("subject", &self.subject)?;
+        dict.set_item("date", self.date)?;
+        dict.set_item("date_read", self.date_read)?;
+        dict.set_item("date_delivered", self.date_delivered)?;
+        dict.set_item("is_from_me", self.is_from_me)?;
+        dict.set_item("is_read", self.is_read)?;
+        dict.set_item("is_sent", self.is_sent)?;
+        dict.set_item("is_delivered", self.is_delivered)?;
+        dict.set_item("cache_roomnames", &self.cache_roomnames)?;
+        dict.set_item("group_title", &self.group_title)?;
+        dict.set_item("associated_message_guid", &self.associated_message_guid)?;
+        dict.set_item("associated_message_type", self.associated_message_type)?;
+        dict.set_item("thread_originator_guid", &self.thread_originator_guid)?;
+        Ok(dict.into())
+    }
+}
+
+#[pymethods]
+impl PyHandle {
+    /// Return all fields as a dict
+    fn to_dict(&self, py: Python) -> PyResult<PyObject> {
+        let dict = PyDict::new(py);
+        dict.set_item("rowid", self.rowid)?;
+        dict.set_item("id", &self.id)?;
+        dict.set_item("service", &self.service)?;
+        dict.set_item("uncanonicalized_id", &self.uncanonicalized_id)?;
+        Ok(dict.into())
+    }
+}
+
+#[pymethods]
+impl PyAttachment {
+    /// Return all fields as a dict
+    fn to_dict(&self, py: Python) -> PyResult<PyObject> {
+        let dict = PyDict::new(py);
+        dict.set_item("rowid", self.rowid)?;
+        dict.set_item("guid", &self.guid)?;
+        dict.set_item("filename", &self.filename)?;
+        dict.set_item("mime_type", &self.mime_type)?;
+        dict.set_item("transfer_name", &self.transfer_name)?;
+        dict.set_item("total_bytes", self.total_bytes)?;
+        Ok(dict.into())
+    }
+}
+
+/// Columns expected by `Message::from_row`, selected from `message as m`
+const MESSAGE_SELECT: &str = "SELECT 
+        m.*,
+        c.chat_id,
+        (SELECT COUNT(*) FROM message_attachment_join a WHERE m.ROWID = a.message_id) as num_attachments,
+        NULL as deleted_from,
+        0 as num_replies
+    FROM message as m
+    LEFT JOIN chat_message_join as c ON m.ROWID = c.message_id";
+
+/// Convert a row selected with `MESSAGE_SELECT` into a PyMessage
+///
+/// Also returns the raw Apple timestamp (nanoseconds since 2001-01-01) so
+/// callers can page on it without a lossy round trip through f64.
+fn row_to_py_message(row: &rusqlite::Row, text_conn: &Connection) -> PyResult<(i64, PyMessage)> {
+    // Create Message from row
+    let mut msg = Message::from_row(row).map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+            format!("Failed to parse message: {}", e)
+        )
+    })?;
+
+    // Try to generate text from attributedBody if text is None
+    let message_text = if msg.text.is_none() || msg.text.as_ref().map(|s| s.is_empty()).unwrap_or(false) {
+        // Try to generate text from attributedBody
+        match msg.generate_text(text_conn) {
+            Ok(text) => Some(text.to_string()),
+            Err(_) => msg.text.clone()
+        }
+    } else {
+        msg.text.clone()
+    };
+
+    let raw_date = msg.date;
+
+    // Convert to PyMessage
+    let py_msg = PyMessage {
+        rowid: msg.rowid,
+        guid: msg.guid,
+        text: message_text,
+        service: msg.service.unwrap_or_else(|| "iMessage".to_string()),
+        handle_id: msg.handle_id,
+        subject: msg.subject,
+        date: (msg.date as f64 / 1_000_000_000.0) + 978307200.0,
+        date_read: if msg.date_read != 0 {
+            Some((msg.date_read as f64 / 1_000_000_000.0) + 978307200.0)
+        } else {
+            None
+        },
+        date_delivered: if msg.date_delivered != 0 {
+            Some((msg.date_delivered as f64 / 1_000_000_000.0) + 978307200.0)
+        } else {
+            None
+        },
+        is_from_me: msg.is_from_me,
+        is_read: msg.is_read,
+        is_sent: true,  // Messages in the database are always sent
+        is_delivered: msg.date_delivered != 0,
+        cache_roomnames: msg.thread_originator_guid.clone(),
+        group_title: msg.group_title,
+        associated_message_guid: msg.associated_message_guid,
+        associated_message_type: msg.associated_message_type,
+        thread_originator_guid: msg.thread_originator_guid,
+    };
+
+    Ok((raw_date, py_msg))
+}
+
+/// Convert a Unix timestamp to Apple's Core Data timestamp in nanoseconds
+fn unix_to_apple_ns(timestamp: f64) -> i64 {
+    (timestamp - 978307200.0) as i64 * 1_000_000_000
+}
+
+/// Open a read-only connection, mapping failures to IOError
+fn open_read_only(db_path: &PathBuf, what: &str) -> PyResult<Connection> {
+    Connection::open_with_flags(db_path, OpenFlags::SQLITE_OPEN_READ_ONLY).map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyIOError, _>(
+            format!("Failed to open database{}: {}", what, e)
+        )
+    })
+}
+
+/// Forward-only iterator over messages, ordered by (date, ROWID)
+///
+/// Holds its own connections and fetches `batch_size` rows at a time using a
+/// keyset cursor, so messages sharing a timestamp are never skipped at batch
+/// boundaries and each page is an index seek rather than a rescan.
+#[pyclass(unsendable)]
+struct MessageIterator {
+    conn: Connection,
+    text_conn: Connection,
+    batch_size: usize,
+    remaining: Option<usize>,
+    last_date: i64,
+    last_rowid: i64,
+    buffer: VecDeque<PyMessage>,
+    exhausted: bool,
+}
+
+impl MessageIterator {
+    fn fill_buffer(&mut self) -> PyResult<()> {
+        let page_size = match self.remaining {
+            Some(remaining) => remaining.min(self.batch_size),
+            None => self.batch_size,
+        };
+        if page_size == 0 {
+            self.exhausted = true;
+            return Ok(());
+        }
+
+        let query = format!(
+            "{}
+            WHERE m.date > ?1 OR (m.date = ?1 AND m.ROWID > ?2)
+            ORDER BY m.date ASC, m.ROWID ASC
+            LIMIT {}",
+            MESSAGE_SELECT,
+            page_size
+        );
+
+        let mut stmt = self.conn.prepare_cached(&query).map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                format!("Failed to prepare query: {}", e)
+            )
+        })?;
+
+        let mut rows = stmt.query(rusqlite::params![self.last_date, self.last_rowid]).map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                format!("Failed to execute query: {}", e)
+            )
+        })?;
+
+        let mut fetched = 0;
+        while let Some(row) = rows.next().map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                format!("Failed to fetch row: {}", e)
+            )
+        })? {
+            let (raw_date, py_msg) = row_to_py_message(row, &self.text_conn)?;
+            self.last_date = raw_date;
+            self.last_rowid = py_msg.rowid as i64;
+            self.buffer.push_back(py_msg);
+            fetched += 1;
+        }
+
+        if let Some(remaining) = self.remaining.as_mut() {
+            *remaining -= fetched;
+        }
+        if fetched < page_size {
+            self.exhausted = true;
+        }
+
+        Ok(())
+    }
+}
+
+#[pymethods]
+impl MessageIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<PyMessage>> {
+        if slf.buffer.is_empty() && !slf.exhausted {
+            slf.fill_buffer()?;
+        }
+        Ok(slf.buffer.pop_front())
+    }
+}
+
+/// Maximum number of rowids bound into a single `IN (...)` clause; stays well
+/// below SQLite's host parameter limit on older builds (999)
+const BULK_CHUNK_SIZE: usize = 500;
+
 /// Main database interface
 #[pyclass(unsendable)]
 struct IMessageDB {
@@ -131,38 +361,26 @@ impl IMessageDB {
 
     /// Query messages after a specific timestamp
     fn query_messages_after(&self, timestamp: f64, limit: Option<usize>) -> PyResult<Vec<PyMessage>> {
-        // Convert Unix timestamp to Apple's Core Data timestamp (seconds since 2001-01-01)
-        let apple_timestamp = timestamp - 978307200.0;
+        // Convert Unix timestamp to Apple's Core Data timestamp (nanoseconds since 2001-01-01)
+        let apple_timestamp = unix_to_apple_ns(timestamp);
         
         let query = if let Some(limit) = limit {
             format!(
-                "SELECT 
-                    m.*,
-                    c.chat_id,
-                    (SELECT COUNT(*) FROM message_attachment_join a WHERE m.ROWID = a.message_id) as num_attachments,
-                    NULL as deleted_from,
-                    0 as num_replies
-                FROM message as m
-                LEFT JOIN chat_message_join as c ON m.ROWID = c.message_id
+                "{}
                 WHERE m.date > {} 
                 ORDER BY m.date ASC 
                 LIMIT {}",
-                apple_timestamp as i64 * 1_000_000_000,  // Convert to nanoseconds
+                MESSAGE_SELECT,
+                apple_timestamp,
                 limit
             )
         } else {
             format!(
-                "SELECT 
-                    m.*,
-                    c.chat_id,
-                    (SELECT COUNT(*) FROM message_attachment_join a WHERE m.ROWID = a.message_id) as num_attachments,
-                    NULL as deleted_from,
-                    0 as num_replies
-                FROM message as m
-                LEFT JOIN chat_message_join as c ON m.ROWID = c.message_id
+                "{}
                 WHERE m.date > {} 
                 ORDER BY m.date ASC",
-                apple_timestamp as i64 * 1_000_000_000
+                MESSAGE_SELECT,
+                apple_timestamp
             )
         };
 
@@ -180,74 +398,61 @@ impl IMessageDB {
         })?;
 
         // We need a separate connection for generate_text
-        let text_conn = Connection::open_with_flags(
-            &self.db_path,
-            OpenFlags::SQLITE_OPEN_READ_ONLY
-        ).map_err(|e| {
-            PyErr::new::<pyo3::exceptions::PyIOError, _>(
-                format!("Failed to open database for text extraction: {}", e)
-            )
-        })?;
+        let text_conn = open_read_only(&self.db_path, " for text extraction")?;
 
         while let Some(row) = rows.next().map_err(|e| {
             PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
                 format!("Failed to fetch row: {}", e)
             )
         })? {
-            // Create Message from row
-            let mut msg = Message::from_row(row).map_err(|e| {
-                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
-                    format!("Failed to parse message: {}", e)
-                )
-            })?;
-
-            // Try to generate text from attributedBody if text is None
-            let message_text = if msg.text.is_none() || msg.text.as_ref().map(|s| s.is_empty()).unwrap_or(false) {
-                // Try to generate text from attributedBody
-                match msg.generate_text(&text_conn) {
-                    Ok(text) => Some(text.to_string()),
-                    Err(_) => msg.text.clone()
-                }
-            } else {
-                msg.text.clone()
-            };
-
-            // Convert to PyMessage
-            let py_msg = PyMessage {
-                rowid: msg.rowid,
-                guid: msg.guid,
-                text: message_text,
-                service: msg.service.unwrap_or_else(|| "iMessage".to_string()),
-                handle_id: msg.handle_id,
-                subject: msg.subject,
-                date: (msg.date as f64 / 1_000_000_000.0) + 978307200.0,
-                date_read: if msg.date_read != 0 {
-                    Some((msg.date_read as f64 / 1_000_000_000.0) + 978307200.0)
-                } else {
-                    None
-                },
-                date_delivered: if msg.date_delivered != 0 {
-                    Some((msg.date_delivered as f64 / 1_000_000_000.0) + 978307200.0)
-                } else {
-                    None
-                },
-                is_from_me: msg.is_from_me,
-                is_read: msg.is_read,
-                is_sent: true,  // Messages in the database are always sent
-                is_delivered: msg.date_delivered != 0,
-                cache_roomnames: msg.thread_originator_guid.clone(),
-                group_title: msg.group_title,
-                associated_message_guid: msg.associated_message_guid,
-                associated_message_type: msg.associated_message_type,
-                thread_originator_guid: msg.thread_originator_guid,
-            };
-
+            let (_, py_msg) = row_to_py_message(row, &text_conn)?;
             messages.push(py_msg);
         }
 
         Ok(messages)
     }
 
+    /// Iterate over messages after a specific timestamp, fetching
+    /// `batch_size` rows at a time and stopping after `limit` messages
+    fn iter_messages_after(
+        &self,
+        timestamp: f64,
+        batch_size: Option<usize>,
+        limit: Option<usize>,
+    ) -> PyResult<MessageIterator> {
+        Ok(MessageIterator {
+            conn: open_read_only(&self.db_path, "")?,
+            text_conn: open_read_only(&self.db_path, " for text extraction")?,
+            batch_size: batch_size.unwrap_or(500).max(1),
+            remaining: limit,
+            last_date: unix_to_apple_ns(timestamp),
+            // With ROWID > i64::MAX never true, the first page is `m.date > timestamp`
+            last_rowid: i64::MAX,
+            buffer: VecDeque::new(),
+            exhausted: false,
+        })
+    }
+
+    /// Count the rows `iter_messages_after` / `query_messages_after` would
+    /// return, capped at `limit`
+    fn count_messages_after(&self, timestamp: f64, limit: Option<usize>) -> PyResult<usize> {
+        let count: i64 = self.conn.query_row(
+            "SELECT COUNT(*)
+             FROM message as m
+             LEFT JOIN chat_message_join as c ON m.ROWID = c.message_id
+             WHERE m.date > ?",
+            [unix_to_apple_ns(timestamp)],
+            |row| row.get(0),
+        ).map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                format!("Failed to count messages: {}", e)
+            )
+        })?;
+
+        let count = count.max(0) as usize;
+        Ok(limit.map_or(count, |limit| count.min(limit)))
+    }
+
     /// Get all messages (use with caution on large databases)
     fn get_all_messages(&self, limit: Option<usize>) -> PyResult<Vec<PyMessage>> {
         self.query_messages_after(0.0, limit)
@@ -393,6 +598,101 @@ impl IMessageDB {
         Ok(result)
     }
 
+    /// Get participants and attachments for a batch of messages
+    ///
+    /// Runs one query per kind (per chunk of rowids) instead of two queries per
+    /// message, and returns both results keyed by message rowid.
+    fn get_messages_children(
+        &self,
+        message_rowids: Vec<i32>,
+    ) -> PyResult<(HashMap<i32, Vec<PyHandle>>, HashMap<i32, Vec<PyAttachment>>)> {
+        let mut participants: HashMap<i32, Vec<PyHandle>> = HashMap::new();
+        let mut attachments: HashMap<i32, Vec<PyAttachment>> = HashMap::new();
+
+        for chunk in message_rowids.chunks(BULK_CHUNK_SIZE) {
+            let placeholders = vec!["?"; chunk.len()].join(", ");
+
+            let mut stmt = self.conn.prepare(&format!(
+                "SELECT DISTINCT cmj.message_id, h.rowid, h.id, h.service, h.uncanonicalized_id
+                 FROM handle h
+                 INNER JOIN chat_handle_join chj ON h.rowid = chj.handle_id
+                 INNER JOIN chat_message_join cmj ON chj.chat_id = cmj.chat_id
+                 WHERE cmj.message_id IN ({})",
+                placeholders
+            )).map_err(|e| {
+                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                    format!("Failed to prepare bulk participants query: {}", e)
+                )
+            })?;
+
+            let rows = stmt.query_map(params_from_iter(chunk.iter()), |row| {
+                Ok((
+                    row.get::<_, i32>(0)?,
+                    PyHandle {
+                        rowid: row.get(1)?,
+                        id: row.get(2)?,
+                        service: row.get(3)?,
+                        uncanonicalized_id: row.get(4)?,
+                    },
+                ))
+            }).map_err(|e| {
+                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                    format!("Failed to execute bulk participants query: {}", e)
+                )
+            })?;
+
+            for row in rows {
+                let (message_id, handle) = row.map_err(|e| {
+                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                        format!("Failed to read participant: {}", e)
+                    )
+                })?;
+                participants.entry(message_id).or_default().push(handle);
+            }
+
+            let mut stmt = self.conn.prepare(&format!(
+                "SELECT maj.message_id, a.rowid, a.guid, a.filename, a.mime_type, a.transfer_name, a.total_bytes
+                 FROM attachment a
+                 INNER JOIN message_attachment_join maj ON a.rowid = maj.attachment_id
+                 WHERE maj.message_id IN ({})",
+                placeholders
+            )).map_err(|e| {
+                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                    format!("Failed to prepare bulk attachments query: {}", e)
+                )
+            })?;
+
+            let rows = stmt.query_map(params_from_iter(chunk.iter()), |row| {
+                Ok((
+                    row.get::<_, i32>(0)?,
+                    PyAttachment {
+                        rowid: row.get(1)?,
+                        guid: row.get(2)?,
+                        filename: row.get(3)?,
+                        mime_type: row.get(4)?,
+                        transfer_name: row.get(5)?,
+                        total_bytes: row.get(6)?,
+                    },
+                ))
+            }).map_err(|e| {
+                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                    format!("Failed to execute bulk attachments query: {}", e)
+                )
+            })?;
+
+            for row in rows {
+                let (message_id, attachment) = row.map_err(|e| {
+                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+                        format!("Failed to read attachment: {}", e)
+                    )
+                })?;
+                attachments.entry(message_id).or_default().push(attachment);
+            }
+        }
+
+        Ok((participants, attachments))
+    }
+
     /// Convert a message to a Python dictionary with all related data
     fn message_to_dict(&self, py: Python, message_rowid: i32) -> PyResult<PyObject> {
         // Get the message
@@ -503,5 +803,6 @@ fn imessage_bridge(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyMessage>()?;
     m.add_class::<PyHandle>()?;
     m.add_class::<PyAttachment>()?;
+    m.add_class::<MessageIterator>()?;
     Ok(())
 }
\ No newline at end of file
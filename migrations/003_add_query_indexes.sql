@@ -0,0 +1,25 @@
+-- Migration 003: Add indexes for the MCP query paths
+--
+-- The MCP search tools look identities up by (kind, normalized) without a
+-- platform, load a page of messages' participants by message_id, and run
+-- ILIKE '%...%' filters over message content and display names. None of
+-- these can use the indexes created by 001.
+
+-- Identity lookups by kind + normalized value across all platforms
+-- (identity_claim_value_idx leads with platform, so it can't serve these)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS identity_claim_kind_normalized_idx
+ON identity_claim (kind, normalized);
+
+-- Participant loading for a page of messages
+-- (the primary key leads with principal_id, so it can't serve message_id IN (...))
+CREATE INDEX CONCURRENTLY IF NOT EXISTS person_message_message_idx
+ON person_message (message_id);
+
+-- Substring (ILIKE) filters on message content and display names
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS message_content_trgm_idx
+ON message USING gin (content gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS principal_display_name_trgm_idx
+ON principal USING gin (display_name gin_trgm_ops);
@@ -150,7 +150,8 @@ class IngestionPipeline:
                     raw_data_iter,
                     total=total_count,
                     desc=f"Processing {platform}",
-                    unit="items"
+                    unit="items",
+                    mininterval=0.5,
                 )
             
             for raw_message in raw_data_iter:
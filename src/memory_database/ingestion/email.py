@@ -1,6 +1,7 @@
 import email
 import mailbox
 import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional
@@ -10,9 +11,34 @@ from tqdm import tqdm
 
 from memory_database.ingestion.base import IngestionSource
 
+# Common address shapes ("Name <addr>", "<addr>", bare "addr") that can skip
+# the full RFC 2822 tokenizer in parseaddr
+_ADDR_ANGLE = re.compile(r'<([^<>@\s]+@[^<>@\s]+)>\s*$')
+_ADDR_BARE = re.compile(r'^\s*([^<>@\s,"()]+@[^<>@\s,"()]+)\s*$')
+
+
+@dataclass(slots=True)
+class ParsedEmail:
+    """A single parsed email as yielded by EmailIngestionSource.extract_raw_data."""
+
+    message_id: str = ''
+    subject: str = ''
+    sender: str = ''
+    recipients: List[str] = field(default_factory=list)
+    date: Optional[datetime] = None
+    content: str = ''
+    in_reply_to: str = ''
+    references: List[str] = field(default_factory=list)
+    headers: Dict[str, Any] = field(default_factory=dict)
+    raw_message: Optional[email.message.Message] = None
+
 
 class EmailIngestionSource(IngestionSource):
     """Ingestion source for email data (MBOX, EML files)."""
+
+    # Upper bound on extracted body text so text/plain attachments of many MB
+    # don't end up in memory and downstream content columns
+    MAX_CONTENT_CHARS = 256 * 1024
     
     def get_platform_name(self) -> str:
         return "email"
@@ -44,7 +70,7 @@ class EmailIngestionSource(IngestionSource):
         except Exception:
             return None
     
-    def extract_raw_data(self, source_path: str) -> Iterator[Dict[str, Any]]:
+    def extract_raw_data(self, source_path: str) -> Iterator[ParsedEmail]:
         """Extract messages from MBOX or EML files."""
         path = Path(source_path)
         
@@ -64,7 +90,7 @@ class EmailIngestionSource(IngestionSource):
         else:
             self.logger.error("Email source path not found", path=str(path))
     
-    def _extract_from_mbox(self, mbox_path: str) -> Iterator[Dict[str, Any]]:
+    def _extract_from_mbox(self, mbox_path: str) -> Iterator[ParsedEmail]:
         """Extract messages from an MBOX file."""
         try:
             mbox = mailbox.mbox(mbox_path)
@@ -73,7 +99,7 @@ class EmailIngestionSource(IngestionSource):
         except Exception as e:
             self.logger.error("Failed to read MBOX file", path=mbox_path, error=str(e))
     
-    def _extract_from_eml(self, eml_path: str) -> Iterator[Dict[str, Any]]:
+    def _extract_from_eml(self, eml_path: str) -> Iterator[ParsedEmail]:
         """Extract a message from an EML file."""
         try:
             with open(eml_path, 'rb') as f:
@@ -82,42 +108,46 @@ class EmailIngestionSource(IngestionSource):
         except Exception as e:
             self.logger.error("Failed to read EML file", path=eml_path, error=str(e))
     
-    def _parse_email_message(self, message: email.message.Message) -> Dict[str, Any]:
+    def _parse_email_message(self, message: email.message.Message) -> ParsedEmail:
         """Parse an email.Message object into our standard format."""
-        return {
-            'message_id': message.get('Message-ID', '').strip('<>'),
-            'subject': self._decode_header(message.get('Subject', '')),
-            'sender': self._parse_address(message.get('From', '')),
-            'recipients': self._parse_address_list(message.get('To', '')) + 
-                         self._parse_address_list(message.get('Cc', '')),
-            'date': self._parse_date(message.get('Date')),
-            'content': self._extract_content(message),
-            'in_reply_to': message.get('In-Reply-To', '').strip('<>'),
-            'references': self._parse_references(message.get('References', '')),
-            'headers': dict(message.items()),
-            'raw_message': message
-        }
+        # Bind helpers locally; this runs once per message on large mailboxes
+        get = message.get
+        parse_address_list = self._parse_address_list
+
+        return ParsedEmail(
+            message_id=get('Message-ID', '').strip('<>'),
+            subject=self._decode_header(get('Subject', '')),
+            sender=self._parse_address(get('From', '')),
+            recipients=parse_address_list(get('To', '')) +
+                       parse_address_list(get('Cc', '')),
+            date=self._parse_date(get('Date')),
+            content=self._extract_content(message),
+            in_reply_to=get('In-Reply-To', '').strip('<>'),
+            references=self._parse_references(get('References', '')),
+            headers=dict(message.items()),
+            raw_message=message,
+        )
     
-    def normalize_message(self, raw_message: Dict[str, Any]) -> Dict[str, Any]:
+    def normalize_message(self, raw_message: ParsedEmail) -> Dict[str, Any]:
         """Normalize email message to standard format."""
         # Use subject as thread identifier for email threading
-        subject = raw_message.get('subject', '').strip()
+        subject = (raw_message.subject or '').strip()
         thread_id = self._normalize_thread_subject(subject) if subject else 'no_subject'
         
         return {
             'platform': self.get_platform_name(),
-            'message_id': raw_message.get('message_id'),
+            'message_id': raw_message.message_id,
             'thread_id': thread_id,
             'subject': subject,
-            'sender': raw_message.get('sender'),
-            'recipients': raw_message.get('recipients', []),
-            'sent_at': raw_message.get('date'),
-            'content': raw_message.get('content'),
+            'sender': raw_message.sender,
+            'recipients': raw_message.recipients,
+            'sent_at': raw_message.date,
+            'content': raw_message.content,
             'content_type': 'text/plain',  # TODO: Better content type detection
-            'reply_to': raw_message.get('in_reply_to'),
-            'references': raw_message.get('references', []),
+            'reply_to': raw_message.in_reply_to,
+            'references': raw_message.references,
             'extra': {
-                'headers': raw_message.get('headers', {}),
+                'headers': raw_message.headers,
                 'subject': subject
             }
         }
@@ -136,7 +166,11 @@ class EmailIngestionSource(IngestionSource):
         """Decode email header that might be encoded."""
         if not header:
             return ''
-        
+
+        # Plain ASCII without RFC 2047 encoded-words needs no decoding
+        if isinstance(header, str) and header.isascii() and '=?' not in header:
+            return header
+
         decoded_parts = []
         for part, encoding in decode_header(header):
             if isinstance(part, bytes):
@@ -155,7 +189,11 @@ class EmailIngestionSource(IngestionSource):
         """Parse an email address, extracting just the email part."""
         if not address_str:
             return ''
-        
+
+        match = _ADDR_ANGLE.search(address_str) or _ADDR_BARE.match(address_str)
+        if match:
+            return match.group(1)
+
         name, email_addr = parseaddr(address_str)
         return email_addr.strip() if email_addr else ''
     
@@ -184,17 +222,28 @@ class EmailIngestionSource(IngestionSource):
             return None
     
     def _extract_content(self, message: email.message.Message) -> str:
-        """Extract text content from email message."""
+        """Extract text content from email message, capped at MAX_CONTENT_CHARS."""
+        limit = self.MAX_CONTENT_CHARS
+
         if message.is_multipart():
             content_parts = []
+            total = 0
+            get_payload_content = self._get_payload_content
             for part in message.walk():
                 if part.get_content_type() == 'text/plain':
-                    content = self._get_payload_content(part)
+                    content = get_payload_content(part)
                     if content:
                         content_parts.append(content)
-            return '\n\n'.join(content_parts)
+                        total += len(content)
+                        if total > limit:
+                            break
+            content = '\n\n'.join(content_parts)
         else:
-            return self._get_payload_content(message) or ''
+            content = self._get_payload_content(message) or ''
+
+        if len(content) > limit:
+            content = content[:limit] + '\n[truncated]'
+        return content
     
     def _get_payload_content(self, part: email.message.Message) -> str:
         """Get text content from a message part."""
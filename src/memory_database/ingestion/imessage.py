@@ -7,21 +7,27 @@ to link messages to existing principals in the database.
 """
 
 import hashlib
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import structlog
 from tqdm import tqdm
 
 from memory_database.ingestion.base import IngestionSource
-from memory_database.utils.normalization import normalize_phone, normalize_email, extract_identity_kind
-from memory_database.utils.identity_resolver import find_existing_principal, link_or_create_principal
+from memory_database.utils.normalization import (
+    normalize_phone, normalize_email, extract_identity_kind, normalize_identity_value
+)
+from memory_database.utils.identity_resolver import link_or_create_principal
 from memory_database.storage.attachment_manager import AttachmentManager
+from memory_database.utils.ulid import generate_ulid
 
 logger = structlog.get_logger()
 
+_UTC = timezone.utc
+
 # Import will be available after building the Rust extension
 try:
     import imessage_bridge
@@ -30,6 +36,50 @@ except ImportError:
     imessage_bridge = None
 
 
+_MESSAGE_FIELDS = (
+    'rowid', 'guid', 'text', 'service', 'handle_id', 'subject', 'date',
+    'date_read', 'date_delivered', 'is_from_me', 'is_read', 'is_sent',
+    'is_delivered', 'cache_roomnames', 'group_title', 'associated_message_guid',
+    'associated_message_type', 'thread_originator_guid',
+)
+_PARTICIPANT_FIELDS = ('rowid', 'id', 'service', 'uncanonicalized_id')
+_ATTACHMENT_FIELDS = ('rowid', 'guid', 'filename', 'mime_type', 'transfer_name', 'total_bytes')
+
+
+def _to_payload(record: Any, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Convert a bridge record into a plain dict.
+
+    Bridge builds with ``to_dict()`` produce the dict in a single call; older
+    builds (and test doubles) fall back to reading each field as an attribute.
+    """
+    to_dict = getattr(record, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    return {name: getattr(record, name) for name in fields}
+
+
+def _scan_dirs(path: Any) -> Iterator[os.DirEntry]:
+    """Yield subdirectory entries of ``path``, treating unreadable directories as empty."""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        yield entry
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
+def _batched(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most ``size`` items."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
 class iMessageIngestionSource(IngestionSource):
     """Ingestion source for iMessage database."""
     
@@ -45,6 +95,8 @@ class iMessageIngestionSource(IngestionSource):
         self.db_path = db_path
         self.imessage_db = None
         self.handle_cache = {}  # Cache for handle lookups
+        self._group_thread_ids: Dict[Tuple[str, ...], str] = {}  # Sorted participant ids -> thread id
+        self._identity_cache: Dict[str, Tuple[str, str]] = {}  # Raw handle -> (kind, normalized)
         self.batch_size = int(os.environ.get("MEMORY_DB_IMESSAGE_BATCH_SIZE", "500"))
 
         attachments_root = os.environ.get(
@@ -56,6 +108,10 @@ class iMessageIngestionSource(IngestionSource):
             self._resolved_attachments_root = self.attachments_root.resolve(strict=False)
         except (OSError, RuntimeError):
             self._resolved_attachments_root = self.attachments_root
+        # Root with a trailing separator, for cheap string containment checks
+        self._attachments_root_prefix = os.path.join(str(self._resolved_attachments_root), '')
+
+        self._guid_index: Optional[Dict[str, List[Path]]] = None  # Built on first fallback lookup
 
         self.attachment_manager = AttachmentManager()  # Initialize attachment manager
         
@@ -101,6 +157,10 @@ class iMessageIngestionSource(IngestionSource):
             }
         
         self.logger.info("Cached handles", count=len(self.handle_cache))
+
+    def sender_handle(self, handle_id: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Return the cached (shared, not copied) handle dict for a message's ``handle_id``."""
+        return self.handle_cache.get(handle_id) if handle_id else None
     
     def extract_raw_data(self, source_path: str) -> Iterator[Dict[str, Any]]:
         """
@@ -121,60 +181,14 @@ class iMessageIngestionSource(IngestionSource):
         
         processed = 0
 
-        for msg in self._stream_messages():
+        for msg, children in self.iter_with_children(self._stream_messages()):
             try:
-                # Get participants for this message
-                participants = self.imessage_db.get_message_participants(msg.rowid)
+                participants, attachments = self.get_children(msg, children)
                 
-                # Get attachments
-                attachments = self.imessage_db.get_message_attachments(msg.rowid)
-                
-                # Get sender handle if available
-                sender_handle = None
-                if msg.handle_id:
-                    sender_handle = self.handle_cache.get(msg.handle_id)
-                
-                payload = {
-                    'rowid': msg.rowid,
-                    'guid': msg.guid,
-                    'text': msg.text,
-                    'service': msg.service,
-                    'handle_id': msg.handle_id,
-                    'sender_handle': sender_handle,
-                    'subject': msg.subject,
-                    'date': msg.date,
-                    'date_read': msg.date_read,
-                    'date_delivered': msg.date_delivered,
-                    'is_from_me': msg.is_from_me,
-                    'is_read': msg.is_read,
-                    'is_sent': msg.is_sent,
-                    'is_delivered': msg.is_delivered,
-                    'cache_roomnames': msg.cache_roomnames,
-                    'group_title': msg.group_title,
-                    'associated_message_guid': msg.associated_message_guid,
-                    'associated_message_type': msg.associated_message_type,
-                    'thread_originator_guid': msg.thread_originator_guid,
-                    'participants': [
-                        {
-                            'rowid': p.rowid,
-                            'id': p.id,
-                            'service': p.service,
-                            'uncanonicalized_id': p.uncanonicalized_id
-                        }
-                        for p in participants
-                    ],
-                    'attachments': [
-                        {
-                            'rowid': a.rowid,
-                            'guid': a.guid,
-                            'filename': a.filename,
-                            'mime_type': a.mime_type,
-                            'transfer_name': a.transfer_name,
-                            'total_bytes': a.total_bytes
-                        }
-                        for a in attachments
-                    ]
-                }
+                payload = _to_payload(msg, _MESSAGE_FIELDS)
+                payload['sender_handle'] = self.sender_handle(payload['handle_id'])
+                payload['participants'] = [_to_payload(p, _PARTICIPANT_FIELDS) for p in participants]
+                payload['attachments'] = [_to_payload(a, _ATTACHMENT_FIELDS) for a in attachments]
 
                 processed += 1
                 yield payload
@@ -196,8 +210,12 @@ class iMessageIngestionSource(IngestionSource):
         Returns:
             Normalized message dictionary
         """
+        # Bound once; this runs for every message in an import
+        get = raw_message.get
+        participants = get('participants') or []
+
         # Convert timestamp to datetime
-        sent_at = datetime.fromtimestamp(raw_message['date'], tz=timezone.utc)
+        sent_at = datetime.fromtimestamp(raw_message['date'], _UTC)
         
         # Determine sender and recipients
         sender = None
@@ -208,25 +226,27 @@ class iMessageIngestionSource(IngestionSource):
             sender = 'me@imessage'  # Special identifier for self
             
             # Recipients are the participants
-            for participant in raw_message.get('participants', []):
+            for participant in participants:
                 if participant['id']:
                     recipients.append(participant['id'])
         else:
             # Message received from someone else
-            if raw_message.get('sender_handle'):
-                sender = raw_message['sender_handle']['id']
-            elif raw_message.get('participants'):
+            sender_handle = get('sender_handle')
+            if sender_handle:
+                sender = sender_handle['id']
+            elif participants:
                 # Use first participant as sender for group messages
-                sender = raw_message['participants'][0]['id'] if raw_message['participants'] else None
+                sender = participants[0]['id']
             
             # User is the recipient
             recipients = ['me@imessage']
         
         # Build content with attachment references
-        content = raw_message.get('text', '')
-        if raw_message.get('attachments'):
+        content = get('text', '')
+        attachments = get('attachments') or []
+        if attachments:
             attachment_refs = []
-            for att in raw_message['attachments']:
+            for att in attachments:
                 if att.get('filename'):
                     attachment_refs.append(f"[Attachment: {att['filename']}]")
                 elif att.get('transfer_name'):
@@ -241,11 +261,14 @@ class iMessageIngestionSource(IngestionSource):
                     content = '\n'.join(attachment_refs)
         
         # Determine thread/channel info
-        thread_id = raw_message.get('cache_roomnames') or raw_message.get('thread_originator_guid')
-        if not thread_id and len(raw_message.get('participants', [])) > 1:
+        thread_id = get('cache_roomnames') or get('thread_originator_guid')
+        if not thread_id and len(participants) > 1:
             # Group message without room name - use participant list as thread ID
-            participant_ids = sorted([p['id'] for p in raw_message['participants']])
-            thread_id = 'group_' + hashlib.md5('_'.join(participant_ids).encode()).hexdigest()[:8]
+            participant_ids = tuple(sorted([p['id'] for p in participants]))
+            thread_id = self._group_thread_ids.get(participant_ids)
+            if thread_id is None:
+                thread_id = 'group_' + hashlib.md5('_'.join(participant_ids).encode()).hexdigest()[:8]
+                self._group_thread_ids[participant_ids] = thread_id
         elif not thread_id and sender:
             # Direct message - use sender as thread ID
             thread_id = f"dm_{sender}"
@@ -257,10 +280,10 @@ class iMessageIngestionSource(IngestionSource):
             'recipients': recipients,
             'content': content,
             'content_type': 'text/plain',
-            'subject': raw_message.get('subject'),
+            'subject': get('subject'),
             'thread_id': thread_id,
-            'channel_name': raw_message.get('group_title') or 'iMessage',
-            'reply_to': raw_message.get('associated_message_guid'),
+            'channel_name': get('group_title') or 'iMessage',
+            'reply_to': get('associated_message_guid'),
             'extra': {
                 'rowid': raw_message['rowid'],
                 'service': raw_message['service'],
@@ -270,7 +293,7 @@ class iMessageIngestionSource(IngestionSource):
                 'date_read': raw_message['date_read'],
                 'date_delivered': raw_message['date_delivered'],
                 'associated_message_type': raw_message['associated_message_type'],
-                'attachments': raw_message.get('attachments', [])
+                'attachments': get('attachments', [])
             }
         }
     
@@ -289,12 +312,12 @@ class iMessageIngestionSource(IngestionSource):
         # Process sender identity
         if sender := message.get('sender'):
             if sender != 'me@imessage':  # Skip self-identifier
-                kind = extract_identity_kind(sender)
+                kind, normalized = self._classify_identity(sender)
                 identities.append({
                     'platform': self.get_platform_name(),
                     'kind': kind,
                     'value': sender,
-                    'normalized': self._normalize_imessage_identity(sender, kind),
+                    'normalized': normalized,
                     'confidence': 1.0,
                     'extra': {'role': 'sender'}
                 })
@@ -302,18 +325,32 @@ class iMessageIngestionSource(IngestionSource):
         # Process recipient identities
         for recipient in message.get('recipients', []):
             if recipient != 'me@imessage':  # Skip self-identifier
-                kind = extract_identity_kind(recipient)
+                kind, normalized = self._classify_identity(recipient)
                 identities.append({
                     'platform': self.get_platform_name(),
                     'kind': kind,
                     'value': recipient,
-                    'normalized': self._normalize_imessage_identity(recipient, kind),
+                    'normalized': normalized,
                     'confidence': 1.0,
                     'extra': {'role': 'recipient'}
                 })
         
         return identities
     
+    def _classify_identity(self, value: str) -> Tuple[str, str]:
+        """
+        Return (kind, normalized) for a raw handle, memoized per value.
+
+        The same few hundred handles recur across every message, so the phone
+        and email normalization only needs to run once per distinct handle.
+        """
+        cached = self._identity_cache.get(value)
+        if cached is None:
+            kind = extract_identity_kind(value)
+            cached = (kind, self._normalize_imessage_identity(value, kind))
+            self._identity_cache[value] = cached
+        return cached
+
     def _normalize_imessage_identity(self, value: str, kind: str) -> str:
         """
         Normalize an iMessage identity value.
@@ -347,22 +384,29 @@ class iMessageIngestionSource(IngestionSource):
         if message_id := message.get('message_id'):
             return hashlib.sha256(message_id.encode()).hexdigest()
         
-        # Fallback to content + timestamp hash
-        hash_data = {
-            'sent_at': message.get('sent_at').isoformat() if message.get('sent_at') else '',
-            'sender': message.get('sender', ''),
-            'content': message.get('content', ''),
-            'thread_id': message.get('thread_id', '')
-        }
-
-        hash_str = json.dumps(hash_data, sort_keys=True)
-        return hashlib.sha256(hash_str.encode()).hexdigest()
+        # Fallback to content + timestamp hash, streamed field by field
+        sent_at = message.get('sent_at')
+        digest = hashlib.sha256(sent_at.isoformat().encode() if sent_at else b'')
+        for field in ('sender', 'content', 'thread_id'):
+            digest.update(b'\x00')
+            digest.update((message.get(field) or '').encode())
+        return digest.hexdigest()
 
     def _stream_messages(self) -> Iterator[Any]:
         """Yield messages in batches to avoid loading the entire corpus into memory."""
         if not self.imessage_db:
             return
 
+        iter_messages = getattr(self.imessage_db, 'iter_messages_after', None)
+        if iter_messages is not None:
+            # The bridge pages with a (date, rowid) cursor on its own connection
+            try:
+                yield from iter_messages(0.0, self.batch_size)
+            except Exception as exc:
+                self.logger.error("Failed to stream messages", error=str(exc))
+            return
+
+        # Older bridge builds: paginate on timestamp from Python
         last_timestamp = 0.0
         safety_hatch = 0
 
@@ -393,31 +437,90 @@ class iMessageIngestionSource(IngestionSource):
                 )
                 break
 
-    def _is_within_attachments_root(self, path: Path) -> bool:
+    def _fetch_message_children(
+        self, messages: List[Any]
+    ) -> Optional[Tuple[Dict[int, list], Dict[int, list]]]:
+        """
+        Fetch participants and attachments for a batch of messages in one bridge call.
+
+        Returns None when the bridge build predates the bulk query or the bulk
+        query fails; callers then fall back to per-message lookups.
+        """
+        bulk_fetch = getattr(self.imessage_db, 'get_messages_children', None)
+        if bulk_fetch is None:
+            return None
+
         try:
-            resolved_candidate = path.resolve(strict=False)
-            resolved_root = self._resolved_attachments_root.resolve(strict=False)
-        except (OSError, RuntimeError):
-            return False
+            return bulk_fetch([msg.rowid for msg in messages])
+        except Exception as exc:
+            self.logger.warning("Bulk participant/attachment fetch failed", error=str(exc))
+            return None
+
+    def iter_with_children(
+        self, messages: Iterable[Any], exclude_guids: Optional[set] = None
+    ) -> Iterator[Tuple[Any, Optional[Tuple[list, list]]]]:
+        """
+        Pair each message with its (participants, attachments), fetched per batch.
+
+        The children are None when no bulk result is available; pass them to
+        get_children() to resolve them either way. Messages whose GUID is in
+        ``exclude_guids`` are yielded with empty children and never fetched.
+        """
+        for batch in _batched(messages, self.batch_size):
+            if exclude_guids:
+                wanted = [msg for msg in batch if msg.guid not in exclude_guids]
+            else:
+                wanted = batch
+            children = self._fetch_message_children(wanted) if wanted else ({}, {})
+            if children is None:
+                for msg in batch:
+                    if exclude_guids and msg.guid in exclude_guids:
+                        yield msg, ([], [])
+                    else:
+                        yield msg, None
+                continue
+
+            participants_by_id, attachments_by_id = children
+            for msg in batch:
+                yield msg, (
+                    participants_by_id.get(msg.rowid, []),
+                    attachments_by_id.get(msg.rowid, []),
+                )
 
+    def get_children(self, msg: Any, children: Optional[Tuple[list, list]]) -> Tuple[list, list]:
+        """Return (participants, attachments) for a message, querying per message if needed."""
+        if children is not None:
+            return children
+        return (
+            self.imessage_db.get_message_participants(msg.rowid),
+            self.imessage_db.get_message_attachments(msg.rowid),
+        )
+
+    def _is_within_attachments_root(self, path: Any) -> bool:
         try:
-            resolved_candidate.relative_to(resolved_root)
-            return True
-        except ValueError:
+            resolved_candidate = os.path.realpath(path)
+        except (OSError, RuntimeError, ValueError):
             return False
 
-    def _resolve_path_within_root(self, candidate: Path) -> Optional[Path]:
-        expanded = candidate.expanduser()
+        return self._is_resolved_within_root(resolved_candidate)
+
+    def _is_resolved_within_root(self, resolved: str) -> bool:
+        # The root was resolved once in __init__
+        prefix = self._attachments_root_prefix
+        return resolved.startswith(prefix) or resolved == prefix[:-1]
+
+    def _resolve_path_within_root(self, candidate: Any) -> Optional[Path]:
+        # Plain os.path string operations; these run for every attachment
         try:
-            resolved = expanded.resolve(strict=False)
-        except (OSError, RuntimeError):
+            resolved = os.path.realpath(os.path.expanduser(candidate))
+        except (OSError, RuntimeError, ValueError):
             self.logger.warning(
                 "Failed to resolve attachment path",
                 requested=str(candidate),
             )
             return None
 
-        if not self._is_within_attachments_root(resolved):
+        if not self._is_resolved_within_root(resolved):
             self.logger.warning(
                 "Attachment path rejected (outside allowed root)",
                 requested=str(candidate),
@@ -425,14 +528,39 @@ class iMessageIngestionSource(IngestionSource):
             )
             return None
 
-        if resolved.exists() and resolved.is_file():
-            return resolved
+        # isfile() is False for missing paths; no separate exists() stat needed
+        if os.path.isfile(resolved):
+            return Path(resolved)
 
         return None
 
     def _safe_filename(self, name: str) -> str:
         return Path(name).name
     
+    def _ensure_guid_index(self) -> Dict[str, List[Path]]:
+        """
+        Map directory names under the attachments root to their paths.
+
+        iMessage usually lays attachments out as ``xx/yy/<guid>/<file>``, but
+        GUID directories can sit deeper. The whole tree is walked once with
+        scandir on first use so misses don't each trigger a recursive search.
+        Like the ``*/<guid>`` glob this replaces, top-level entries are not
+        indexed and symlinked directories are indexed but not descended into.
+        """
+        if self._guid_index is None:
+            index: Dict[str, List[Path]] = {}
+            pending = [(self.attachments_root, False)]
+            while pending:
+                path, nested = pending.pop()
+                for entry in _scan_dirs(path):
+                    if nested:
+                        index.setdefault(entry.name, []).append(Path(entry.path))
+                    if not entry.is_symlink():
+                        pending.append((entry.path, True))
+            self._guid_index = index
+            self.logger.debug("Indexed attachment directories", count=len(index))
+        return self._guid_index
+
     def resolve_attachment_path(self, guid: str, filename: Optional[str] = None) -> Optional[Path]:
         """
         Resolve iMessage attachment path from GUID.
@@ -481,7 +609,7 @@ class iMessageIngestionSource(IngestionSource):
                 # Check the most likely location
                 possible_path = attachments_root / dir1 / dir2 / guid
 
-                if possible_path.exists() and possible_path.is_dir() and self._is_within_attachments_root(possible_path):
+                if possible_path.is_dir() and self._is_within_attachments_root(possible_path):
                     # If we have a filename, look for it specifically
                     if safe_filename:
                         candidate = possible_path / safe_filename
@@ -493,15 +621,15 @@ class iMessageIngestionSource(IngestionSource):
                         for item in possible_path.iterdir():
                             if not item.is_file():
                                 continue
-                            candidate = item.resolve(strict=False)
-                            if self._is_within_attachments_root(candidate):
-                                return candidate
+                            candidate = os.path.realpath(item)
+                            if self._is_resolved_within_root(candidate):
+                                return Path(candidate)
         
-        # Fallback: search for the GUID directory
+        # Fallback: look the GUID directory up anywhere under the root
         self.logger.debug("Searching for attachment", guid=guid, filename=filename)
         
         try:
-            for path in attachments_root.rglob(f"*/{guid}"):
+            for path in self._ensure_guid_index().get(guid, ()):
                 if path.is_dir() and self._is_within_attachments_root(path):
                     if safe_filename:
                         candidate = path / safe_filename
@@ -513,9 +641,9 @@ class iMessageIngestionSource(IngestionSource):
                         for item in path.iterdir():
                             if not item.is_file():
                                 continue
-                            candidate = item.resolve(strict=False)
-                            if self._is_within_attachments_root(candidate):
-                                return candidate
+                            candidate = os.path.realpath(item)
+                            if self._is_resolved_within_root(candidate):
+                                return Path(candidate)
         except Exception as e:
             self.logger.error("Error searching for attachment", guid=guid, error=str(e))
         
@@ -526,10 +654,17 @@ class iMessageIncrementalPipeline:
     """Pipeline for incremental iMessage import with identity resolution."""
 
     DEFAULT_REWIND_SECONDS = 30
+    # GUIDs per IN (...) clause when checking which candidates already exist
+    EXISTENCE_CHECK_CHUNK = 900
+    # New messages written per bulk insert + commit
+    DEFAULT_COMMIT_BATCH_SIZE = 1000
+    # Threads copying attachment files while messages keep being processed
+    ATTACHMENT_WORKERS = 4
 
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, commit_batch_size: Optional[int] = None):
         self.db_manager = db_manager
         self.logger = structlog.get_logger()
+        self.commit_batch_size = max(1, commit_batch_size or self.DEFAULT_COMMIT_BATCH_SIZE)
 
     def _infer_last_ingested_state(self, session) -> Optional[Dict[str, Any]]:
         """Inspect the database to locate the most recent iMessage that was imported."""
@@ -561,6 +696,201 @@ class iMessageIncrementalPipeline:
             'message_guid': last_message.message_id,
         }
 
+    def _load_contact_index(self, session) -> Dict[Tuple[str, str], str]:
+        """
+        Map (kind, normalized) of every contacts-platform identity claim to its principal.
+
+        Mirrors find_existing_principal's choice for a single identity (most
+        matching claims, then highest confidence) so known-contact filtering
+        can be done in memory instead of one query per identity.
+        """
+        from memory_database.models import IdentityClaim
+
+        scores: Dict[Tuple[str, str], Dict[str, float]] = {}
+        rows = session.query(
+            IdentityClaim.kind,
+            IdentityClaim.normalized,
+            IdentityClaim.principal_id,
+            IdentityClaim.confidence,
+        ).filter(IdentityClaim.platform == 'contacts').yield_per(1000)
+
+        for kind, normalized, principal_id, confidence in rows:
+            per_principal = scores.setdefault((kind, normalized), {})
+            per_principal[principal_id] = per_principal.get(principal_id, 0.0) + 1000 + (confidence or 0.0)
+
+        return {
+            key: max(per_principal, key=per_principal.get)
+            for key, per_principal in scores.items()
+        }
+
+    def _iter_candidates(
+        self, session, source: iMessageIngestionSource, messages: Iterable[Any], existing_guids: set
+    ) -> Iterator[Tuple[Any, Optional[Tuple[list, list]]]]:
+        """
+        Yield (message, children) for each candidate, one bridge batch at a time.
+
+        Before each batch is handed out, the GUIDs already in the database are
+        added to ``existing_guids`` (a few IN queries per batch) so callers can
+        skip them; their participants and attachments are never fetched.
+        """
+        from memory_database.models import Message
+        from sqlalchemy import bindparam, select
+
+        # Built once; only the expanding GUID list changes between executions
+        existing_stmt = select(Message.message_id).where(
+            Message.message_id.in_(bindparam('guids', expanding=True))
+        )
+
+        for batch in _batched(messages, source.batch_size):
+            for guid_chunk in _batched((m.guid for m in batch), self.EXISTENCE_CHECK_CHUNK):
+                existing_guids.update(session.scalars(existing_stmt, {'guids': guid_chunk}))
+            yield from source.iter_with_children(batch, exclude_guids=existing_guids)
+
+    def _collect_attachments(
+        self,
+        pending: List[Tuple[Any, Dict[str, Any], int, str]],
+        att_rows: List[Dict[str, Any]],
+        stats: Dict[str, Any],
+    ) -> None:
+        """Wait for queued attachment copies and buffer their database rows."""
+        for future, att, idx, message_pk in pending:
+            try:
+                attachment_data = future.result()
+            except FileNotFoundError:
+                self.logger.warning(
+                    "Attachment file not found",
+                    guid=att['guid'],
+                    filename=att.get('filename')
+                )
+                stats['attachments_failed'] += 1
+                continue
+            except Exception as e:
+                self.logger.error(
+                    "Failed to process attachment",
+                    guid=att['guid'],
+                    error=str(e),
+                    exc_info=True
+                )
+                stats['attachments_failed'] += 1
+                continue
+
+            att_rows.append({
+                'id': attachment_data['id'],
+                'message_id': message_pk,
+                'original_path': attachment_data['original_path'],
+                'stored_path': attachment_data['stored_path'],
+                'filename': attachment_data['filename'],
+                'file_size': attachment_data['file_size'],
+                'mime_type': attachment_data['mime_type'],
+                'width': attachment_data['width'],
+                'height': attachment_data['height'],
+                'duration': attachment_data['duration'],
+                'imessage_guid': att['guid'],
+                'imessage_rowid': att.get('rowid'),
+                'attachment_index': idx,
+                'storage_method': attachment_data['storage_method'],
+                'extra_metadata': {
+                    'transfer_name': att.get('transfer_name'),
+                    'total_bytes': att.get('total_bytes')
+                },
+            })
+
+            self.logger.debug(
+                "Stored attachment",
+                message_id=message_pk,
+                filename=attachment_data['filename'],
+                method=attachment_data['storage_method']
+            )
+        pending.clear()
+
+    @staticmethod
+    def _batch_counts(stats: Dict[str, Any], counted_principals: Dict[str, None]) -> Tuple[int, int, int, int]:
+        """Principal counts at the start of a batch, for _discard_batch_counts."""
+        return (
+            stats['new_principals'],
+            stats['new_identities'],
+            stats['linked_principals'],
+            len(counted_principals),
+        )
+
+    @staticmethod
+    def _discard_batch_counts(
+        stats: Dict[str, Any],
+        counted_principals: Dict[str, None],
+        batch_start: Tuple[int, int, int, int],
+    ) -> None:
+        """Reset the principal counts to ``batch_start`` after its batch was discarded."""
+        stats['new_principals'], stats['new_identities'], stats['linked_principals'], counted = batch_start
+        while len(counted_principals) > counted:
+            counted_principals.popitem()
+
+    def _flush_pending_rows(
+        self,
+        session,
+        batch,
+        msg_rows: List[Dict[str, Any]],
+        pm_rows: List[Dict[str, Any]],
+        att_rows: List[Dict[str, Any]],
+        touched_principals: Set[str],
+        stats: Dict[str, Any],
+        attachment_manager: Any,
+    ) -> bool:
+        """
+        Bulk-insert buffered message rows, then the rows that reference them.
+
+        ``batch`` is the SAVEPOINT opened when the batch started, so the
+        principals, threads and channel it created are released or rolled back
+        together with its messages. A failure only discards that batch and
+        leaves the session usable for the rest of the import. Attachment files
+        already copied for a discarded batch are removed again.
+
+        ``touched_principals`` are principals the batch resolved from the
+        import's caches; their claims' last_seen is refreshed here once per
+        batch, as link_or_create_principal does for the ones it looks up.
+
+        Returns:
+            True if the batch was written, False if it was discarded
+        """
+        from memory_database.models import Message, PersonMessage, MessageAttachment, IdentityClaim
+        from sqlalchemy import insert, update
+        from sqlalchemy.exc import SQLAlchemyError
+
+        try:
+            with batch:
+                # Threads and principals created since the last flush must exist first
+                session.flush()
+                if touched_principals:
+                    session.execute(
+                        update(IdentityClaim)
+                        .where(IdentityClaim.principal_id.in_(touched_principals))
+                        .values(last_seen=datetime.now(_UTC))
+                    )
+                if msg_rows:
+                    session.execute(insert(Message), msg_rows)
+                if pm_rows:
+                    session.execute(insert(PersonMessage), pm_rows)
+                if att_rows:
+                    session.execute(insert(MessageAttachment), att_rows)
+        except SQLAlchemyError as e:
+            stats['new_messages'] -= len(msg_rows)
+            self.logger.error("Failed to write iMessage batch",
+                              messages=len(msg_rows),
+                              error=str(e),
+                              exc_info=True)
+            for row in att_rows:
+                attachment_manager.remove_attachment(row['stored_path'])
+            return False
+        else:
+            if att_rows:
+                stats['attachments_stored'] += len(att_rows)
+                self.logger.info("Stored attachments for batch", count=len(att_rows))
+            return True
+        finally:
+            msg_rows.clear()
+            pm_rows.clear()
+            att_rows.clear()
+            touched_principals.clear()
+
     def run_incremental_import(
         self,
         db_path: Optional[str] = None,
@@ -581,8 +911,8 @@ class iMessageIncrementalPipeline:
         Returns:
             Import statistics dictionary
         """
-        from memory_database.models import Message, Channel, Thread, PersonMessage, MessageAttachment
-        from sqlalchemy import and_
+        from memory_database.models import Channel, Thread
+        from sqlalchemy import select
         
         source = iMessageIngestionSource(self.db_manager, db_path)
         source.connect()
@@ -647,74 +977,101 @@ class iMessageIncrementalPipeline:
             known_contacts_only=known_contacts_only,
         )
 
-        messages = source.imessage_db.query_messages_after(effective_start, limit)
-        stats['candidate_messages'] = len(messages)
+        imessage_db = source.imessage_db
+        if hasattr(imessage_db, 'iter_messages_after') and hasattr(imessage_db, 'count_messages_after'):
+            # Stream candidates from the bridge instead of materializing them all
+            stats['candidate_messages'] = imessage_db.count_messages_after(effective_start, limit)
+            messages = imessage_db.iter_messages_after(effective_start, source.batch_size, limit)
+        else:
+            messages = imessage_db.query_messages_after(effective_start, limit)
+            stats['candidate_messages'] = len(messages)
 
-        if not messages:
+        if not stats['candidate_messages']:
             self.logger.info("No new iMessage records detected", query_start=effective_start)
             return stats
 
         latest_processed = None
 
-        with self.db_manager.get_session() as session:
+        with self.db_manager.get_session() as session, \
+                ThreadPoolExecutor(max_workers=self.ATTACHMENT_WORKERS) as attachment_pool:
+            # Cached threads stay valid across batch commits (this import is
+            # their only writer), so don't expire and reload them each time
+            session.expire_on_commit = False
+            existing_guids = set()
+            # New rows are buffered and bulk-inserted at each commit point
+            msg_rows: List[Dict[str, Any]] = []
+            pm_rows: List[Dict[str, Any]] = []
+            att_rows: List[Dict[str, Any]] = []
+            # Attachment copies in flight: (future, attachment, index, message id)
+            pending_attachments: List[Tuple[Any, Dict[str, Any], int, str]] = []
+            contact_index = self._load_contact_index(session) if known_contacts_only else None
+            # (kind, normalized) -> principal id resolved earlier in this import
+            principal_cache: Dict[Tuple[str, str], str] = {}
+            # (sender, recipients) -> ((principal id, role) links, identities resolved)
+            link_cache: Dict[Tuple[Any, Tuple[str, ...]], Tuple[Tuple[Tuple[str, str], ...], int]] = {}
+            # Principals already counted as new or linked, so each is counted
+            # once; insertion-ordered so a discarded batch's entries can be dropped
+            counted_principals: Dict[str, None] = {}
+            # Principals this batch resolved from the caches above
+            touched_principals: Set[str] = set()
+
+            # All iMessage threads live under one channel; look it up once and only
+            # create it when the first message is actually imported
+            channel = None
+            channel_pk = session.scalar(
+                select(Channel.id).where(
+                    Channel.platform == 'imessage',
+                    Channel.channel_id == 'imessage_default',
+                )
+            )
+
+            # Imports touch few threads relative to messages, so keep them all in
+            # memory keyed by the source thread id instead of querying per message
+            thread_cache: Dict[str, Any] = {}
+            if channel_pk is not None:
+                thread_cache = {
+                    thread.thread_id: thread
+                    for thread in session.scalars(
+                        select(Thread).where(Thread.channel_id == channel_pk)
+                    )
+                }
+
             # Process each message with progress bar
             message_iter = tqdm(
-                messages, 
+                self._iter_candidates(session, source, messages, existing_guids),
+                total=stats['candidate_messages'],
                 desc="Processing iMessages", 
-                unit="messages"
+                unit="messages",
+                mininterval=0.5,
             )
             
-            for raw_msg in message_iter:
+            # Each batch runs inside its own SAVEPOINT, see _flush_pending_rows
+            batch = session.begin_nested()
+            batch_start = self._batch_counts(stats, counted_principals)
+            for raw_msg, children in message_iter:
                 try:
                     stats['total_processed'] += 1
+
+                    # Skip already-imported messages before doing any per-message work
+                    if raw_msg.guid in existing_guids:
+                        latest_processed = datetime.fromtimestamp(raw_msg.date, _UTC)
+                        stats['skipped_messages'] += 1
+                        continue
                     
                     # Convert to raw message format expected by source
-                    raw_message = {
-                        'rowid': raw_msg.rowid,
-                        'guid': raw_msg.guid,
-                        'text': raw_msg.text,
-                        'service': raw_msg.service,
-                        'handle_id': raw_msg.handle_id,
-                        'sender_handle': source.handle_cache.get(raw_msg.handle_id) if raw_msg.handle_id else None,
-                        'subject': raw_msg.subject,
-                        'date': raw_msg.date,
-                        'date_read': raw_msg.date_read,
-                        'date_delivered': raw_msg.date_delivered,
-                        'is_from_me': raw_msg.is_from_me,
-                        'is_read': raw_msg.is_read,
-                        'is_sent': raw_msg.is_sent,
-                        'is_delivered': raw_msg.is_delivered,
-                        'cache_roomnames': raw_msg.cache_roomnames,
-                        'group_title': raw_msg.group_title,
-                        'associated_message_guid': raw_msg.associated_message_guid,
-                        'associated_message_type': raw_msg.associated_message_type,
-                        'thread_originator_guid': raw_msg.thread_originator_guid,
-                        'participants': [],
-                        'attachments': []
-                    }
+                    raw_message = _to_payload(raw_msg, _MESSAGE_FIELDS)
+                    raw_message['sender_handle'] = source.sender_handle(raw_message['handle_id'])
+                    raw_message['participants'] = []
+                    raw_message['attachments'] = []
                     
                     # Get participants and attachments
                     try:
+                        participants, attachments = source.get_children(raw_msg, children)
                         raw_message['participants'] = [
-                            {
-                                'rowid': p.rowid,
-                                'id': p.id,
-                                'service': p.service,
-                                'uncanonicalized_id': p.uncanonicalized_id
-                            }
-                            for p in source.imessage_db.get_message_participants(raw_msg.rowid)
+                            _to_payload(p, _PARTICIPANT_FIELDS) for p in participants
                         ]
-                        
                         raw_message['attachments'] = [
-                            {
-                                'rowid': a.rowid,
-                                'guid': a.guid,
-                                'filename': a.filename,
-                                'mime_type': a.mime_type,
-                                'transfer_name': a.transfer_name,
-                                'total_bytes': a.total_bytes
-                            }
-                            for a in source.imessage_db.get_message_attachments(raw_msg.rowid)
+                            _to_payload(a, _ATTACHMENT_FIELDS) for a in attachments
                         ]
                     except Exception as e:
                         self.logger.warning("Failed to get participants/attachments",
@@ -723,114 +1080,156 @@ class iMessageIncrementalPipeline:
                     # Normalize the message
                     normalized = source.normalize_message(raw_message)
 
-                    latest_processed = normalized['sent_at']
+                    # Fields used repeatedly below, read from the dict once
+                    sent_at = normalized['sent_at']
+                    sender = normalized.get('sender')
+                    recipients = tuple(normalized.get('recipients', ()))
+                    latest_processed = sent_at
 
-                    # Check if message already exists
-                    existing_message = session.query(Message).filter_by(
-                        message_id=normalized['message_id']
-                    ).first()
-                    
-                    if existing_message:
-                        stats['skipped_messages'] += 1
-                        continue
-                    
-                    # Extract identities and resolve principals
-                    identities = source.extract_identities(normalized)
-                    identity_principals = {}
-                    has_known_contact = False
+                    # Resolve principals. Once its handles are resolved, a given
+                    # (sender, recipients) combination always yields the same links,
+                    # so repeats within a conversation skip identity resolution
+                    participants_key = (sender, recipients)
+                    cached_links = link_cache.get(participants_key)
+                    if cached_links is not None:
+                        links, resolved = cached_links
+                        has_known_contact = resolved > 0
+                        if not known_contacts_only:
+                            touched_principals.update(principal_id for principal_id, _ in links)
+                    else:
+                        # Extract identities and resolve principals
+                        identities = source.extract_identities(normalized)
+                        identity_principals = {}
+                        has_known_contact = False
+                        resolved = 0
                     
-                    for identity in identities:
-                        # If filtering for known contacts only, check if principal exists
-                        if known_contacts_only:
-                            # Only look for existing principals, don't create new ones
-                            existing_principal = find_existing_principal(
-                                session,
-                                [identity],
-                                platforms=['contacts']  # Only look in contacts platform
-                            )
+                        for identity in identities:
+                            # If filtering for known contacts only, check if principal exists
+                            if known_contacts_only:
+                                # Only look for existing principals in contacts, don't create new ones
+                                normalized_value = identity['normalized'] or normalize_identity_value(
+                                    identity['value'], identity['kind']
+                                )
+                                principal_id = contact_index.get((identity['kind'], normalized_value))
                             
-                            if existing_principal:
-                                identity_principals[identity['value']] = existing_principal.id
-                                has_known_contact = True
-                                stats['linked_principals'] += 1
+                                if principal_id:
+                                    identity_principals[identity['value']] = principal_id
+                                    has_known_contact = True
+                                    resolved += 1
+                                    if principal_id not in counted_principals:
+                                        counted_principals[principal_id] = None
+                                        stats['linked_principals'] += 1
+                                else:
+                                    # Principal not found in contacts
+                                    continue
                             else:
-                                # Principal not found in contacts
-                                continue
-                        else:
-                            # Normal behavior: create principal if not exists
-                            principal, is_new = link_or_create_principal(
-                                session,
-                                [identity],
-                                display_name=identity['value'],
-                                platforms=['contacts', 'imessage'],
-                                extra={'source': 'imessage'}
-                            )
+                                # Repeat senders/recipients reuse the first resolution;
+                                # their claims are refreshed when the batch is written
+                                cache_key = (identity['kind'], identity['normalized'])
+                                principal_id = principal_cache.get(cache_key)
+                                if principal_id:
+                                    identity_principals[identity['value']] = principal_id
+                                    touched_principals.add(principal_id)
+                                    has_known_contact = True
+                                    continue
+
+                                # Normal behavior: create principal if not exists
+                                principal, is_new = link_or_create_principal(
+                                    session,
+                                    [identity],
+                                    display_name=identity['value'],
+                                    platforms=['contacts', 'imessage'],
+                                    extra={'source': 'imessage'}
+                                )
                             
-                            identity_principals[identity['value']] = principal.id
+                                identity_principals[identity['value']] = principal.id
+                                if identity['normalized']:
+                                    principal_cache[cache_key] = principal.id
                             
-                            if is_new:
-                                stats['new_principals'] += 1
-                                stats['new_identities'] += 1
-                            else:
-                                stats['linked_principals'] += 1
-                                has_known_contact = True
+                                if is_new:
+                                    stats['new_principals'] += 1
+                                    stats['new_identities'] += 1
+                                    counted_principals[principal.id] = None
+                                else:
+                                    if principal.id not in counted_principals:
+                                        counted_principals[principal.id] = None
+                                        stats['linked_principals'] += 1
+                                    has_known_contact = True
+                    
+                        # Create person-message links; (principal, role) is part of
+                        # the primary key, so handles resolving to one principal link
+                        # once. extract_identities never yields 'me@imessage', so
+                        # membership in identity_principals already excludes it
+                        linked = {
+                            (identity_principals[recipient], 'recipient')
+                            for recipient in recipients
+                            if recipient in identity_principals
+                        }
+                        if sender in identity_principals:
+                            linked.add((identity_principals[sender], 'sender'))
+                        links = tuple(linked)
+
+                        # Identities without a normalized value get a fresh principal
+                        # every time, so only fully cached resolutions are reusable
+                        if known_contacts_only:
+                            link_cache[participants_key] = (links, resolved)
+                        elif all(identity['normalized'] for identity in identities):
+                            link_cache[participants_key] = (links, len(identities))
                     
                     # Skip message if filtering for known contacts and none found
                     if known_contacts_only and not has_known_contact:
                         stats['skipped_unknown_contacts'] += 1
                         continue
                     
-                    # Get or create channel
-                    channel = session.query(Channel).filter_by(
-                        platform='imessage',
-                        channel_id='imessage_default'
-                    ).first()
-                    
-                    if not channel:
+                    # Create the channel on first use. Channel and thread ids are
+                    # assigned here so neither needs its own flush; both are
+                    # written by the flush that precedes each batch insert
+                    if channel_pk is None:
+                        channel_pk = generate_ulid()
                         channel = Channel(
+                            id=channel_pk,
                             platform='imessage',
                             name='iMessage',
                             channel_id='imessage_default',
                             extra={}
                         )
                         session.add(channel)
-                        session.flush()
                     
                     # Get or create thread
                     thread_id = normalized.get('thread_id', 'default')
-                    thread = session.query(Thread).filter_by(
-                        channel_id=channel.id,
-                        thread_id=thread_id
-                    ).first()
+                    thread = thread_cache.get(thread_id)
                     
                     if not thread:
                         thread = Thread(
-                            channel_id=channel.id,
+                            id=generate_ulid(),
+                            channel_id=channel_pk,
                             subject=normalized.get('subject'),
-                            started_at=normalized['sent_at'],
-                            last_at=normalized['sent_at'],
+                            started_at=sent_at,
+                            last_at=sent_at,
                             thread_id=thread_id,
                             extra={'group_title': normalized.get('channel_name')}
                         )
                         session.add(thread)
-                        session.flush()
+                        thread_cache[thread_id] = thread
                     else:
                         # Update last_at if newer
-                        if normalized['sent_at'] > thread.last_at:
-                            thread.last_at = normalized['sent_at']
+                        if sent_at > thread.last_at:
+                            thread.last_at = sent_at
                     
-                    # Create the message
-                    message = Message(
-                        thread_id=thread.id,
-                        sent_at=normalized['sent_at'],
-                        content=normalized.get('content', ''),
-                        content_type=normalized.get('content_type', 'text/plain'),
-                        message_id=normalized['message_id'],
-                        reply_to=None,  # Will handle reply relationships later
-                        extra=normalized.get('extra', {})
-                    )
-                    session.add(message)
-                    session.flush()
+                    # Create the message; its ULID is assigned here so dependent
+                    # rows can reference it before the batch is written
+                    message_pk = generate_ulid()
+                    msg_rows.append({
+                        'id': message_pk,
+                        'thread_id': thread.id,
+                        'sent_at': sent_at,
+                        'content': normalized.get('content', ''),
+                        'content_type': normalized.get('content_type', 'text/plain'),
+                        'message_id': normalized['message_id'],
+                        'reply_to': None,  # Will handle reply relationships later
+                        'extra': normalized.get('extra', {}),
+                    })
+                    existing_guids.add(normalized['message_id'])
                     
                     # Process attachments if any
                     if raw_message.get('attachments'):
@@ -842,45 +1241,20 @@ class iMessageIncrementalPipeline:
                                     att.get('filename') or att.get('transfer_name')
                                 )
                                 
-                                if attachment_path and attachment_path.exists():
-                                    # Store the attachment
-                                    attachment_data = source.attachment_manager.store_attachment(
+                                # resolve_attachment_path only returns existing files;
+                                # one that vanishes before the copy surfaces as
+                                # FileNotFoundError from store_attachment
+                                if attachment_path:
+                                    # Copy in the background; the row is built when
+                                    # the batch is written
+                                    future = attachment_pool.submit(
+                                        source.attachment_manager.store_attachment,
                                         source_path=attachment_path,
-                                        message_id=message.id,
-                                        sent_at=normalized['sent_at'],
+                                        message_id=message_pk,
+                                        sent_at=sent_at,
                                         attachment_index=idx
                                     )
-                                    
-                                    # Create database record
-                                    db_attachment = MessageAttachment(
-                                        id=attachment_data['id'],
-                                        message_id=message.id,
-                                        original_path=attachment_data['original_path'],
-                                        stored_path=attachment_data['stored_path'],
-                                        filename=attachment_data['filename'],
-                                        file_size=attachment_data['file_size'],
-                                        mime_type=attachment_data['mime_type'],
-                                        width=attachment_data['width'],
-                                        height=attachment_data['height'],
-                                        duration=attachment_data['duration'],
-                                        imessage_guid=att['guid'],
-                                        imessage_rowid=att.get('rowid'),
-                                        attachment_index=idx,
-                                        storage_method=attachment_data['storage_method'],
-                                        extra_metadata={
-                                            'transfer_name': att.get('transfer_name'),
-                                            'total_bytes': att.get('total_bytes')
-                                        }
-                                    )
-                                    session.add(db_attachment)
-                                    
-                                    self.logger.info(
-                                        "Stored attachment",
-                                        message_id=message.id,
-                                        filename=attachment_data['filename'],
-                                        method=attachment_data['storage_method']
-                                    )
-                                    stats['attachments_stored'] += 1
+                                    pending_attachments.append((future, att, idx, message_pk))
                                 else:
                                     self.logger.warning(
                                         "Attachment file not found",
@@ -898,31 +1272,41 @@ class iMessageIncrementalPipeline:
                                 stats['attachments_failed'] += 1
                     
                     # Create person-message links
-                    if sender := normalized.get('sender'):
-                        if sender != 'me@imessage' and sender in identity_principals:
-                            person_message = PersonMessage(
-                                principal_id=identity_principals[sender],
-                                message_id=message.id,
-                                role='sender',
-                                confidence=1.0
-                            )
-                            session.add(person_message)
-                    
-                    for recipient in normalized.get('recipients', []):
-                        if recipient != 'me@imessage' and recipient in identity_principals:
-                            person_message = PersonMessage(
-                                principal_id=identity_principals[recipient],
-                                message_id=message.id,
-                                role='recipient',
-                                confidence=1.0
-                            )
-                            session.add(person_message)
+                    pm_rows.extend(
+                        {
+                            'principal_id': principal_id,
+                            'message_id': message_pk,
+                            'role': role,
+                            'confidence': 1.0,
+                        }
+                        for principal_id, role in links
+                    )
                     
                     stats['new_messages'] += 1
                     
-                    # Commit periodically
-                    if stats['total_processed'] % 100 == 0:
+                    # Commit once a full batch of new messages is buffered
+                    if len(msg_rows) >= self.commit_batch_size:
+                        self._collect_attachments(pending_attachments, att_rows, stats)
+                        written = self._flush_pending_rows(
+                            session, batch, msg_rows, pm_rows, att_rows,
+                            touched_principals, stats, source.attachment_manager
+                        )
                         session.commit()
+                        # Drop principals and claims loaded for this batch so the
+                        # identity map stays bounded; only the thread cache is kept
+                        session.expunge_all()
+                        if not written:
+                            # Principals the discarded batch created are gone, and
+                            # a channel or threads it was first to write must be
+                            # written again by the next batch
+                            self._discard_batch_counts(stats, counted_principals, batch_start)
+                            principal_cache.clear()
+                            link_cache.clear()
+                            if channel is not None:
+                                session.add(channel)
+                        session.add_all(thread_cache.values())
+                        batch = session.begin_nested()
+                        batch_start = self._batch_counts(stats, counted_principals)
                 
                 except Exception as e:
                     self.logger.error("Failed to process message",
@@ -932,6 +1316,12 @@ class iMessageIncrementalPipeline:
                     continue
             
             # Final commit
+            self._collect_attachments(pending_attachments, att_rows, stats)
+            if not self._flush_pending_rows(
+                session, batch, msg_rows, pm_rows, att_rows, touched_principals, stats,
+                source.attachment_manager
+            ):
+                self._discard_batch_counts(stats, counted_principals, batch_start)
             session.commit()
 
         if latest_processed:
@@ -0,0 +1,61 @@
+"""
+Short-lived caches for person lookups made by the MCP tools.
+
+Lookups are memoized for a TTL window, since contacts also change through
+ingestion, and every cache is dropped by invalidate_person_caches(), which
+each contact write tool calls. Misses (None) are never stored, so a contact
+created meanwhile is found on the next call.
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_LOCK = threading.Lock()
+_CACHES: List["OrderedDict[Tuple[Any, ...], Tuple[float, Any]]"] = []
+# Bumped by invalidate_person_caches(); a lookup that started before the bump
+# doesn't store its (possibly stale) result
+_generation = 0
+
+
+def cached_person_lookup(ttl: float, maxsize: int = 1024) -> Callable[[F], F]:
+    """Memoize a lookup by its positional arguments for `ttl` seconds, skipping None results."""
+    def decorator(fn: F) -> F:
+        entries: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+        _CACHES.append(entries)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any) -> Any:
+            now = time.monotonic()
+            with _LOCK:
+                hit = entries.get(args)
+                if hit is not None and hit[0] > now:
+                    entries.move_to_end(args)
+                    return hit[1]
+                generation = _generation
+            value = fn(*args)
+            if value is not None:
+                with _LOCK:
+                    if generation == _generation:
+                        entries[args] = (now + ttl, value)
+                        entries.move_to_end(args)
+                        while len(entries) > maxsize:
+                            entries.popitem(last=False)
+            return value
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def invalidate_person_caches() -> None:
+    """Drop every cached person lookup; call after any contact write."""
+    global _generation
+    with _LOCK:
+        _generation += 1
+        for entries in _CACHES:
+            entries.clear()
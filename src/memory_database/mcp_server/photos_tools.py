@@ -15,22 +15,32 @@ Requirements:
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import bisect
+import operator
 import json as _json
 import datetime as _dt
 import os
+import shutil
 import tempfile
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import structlog
+from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
 from fastmcp.utilities.types import Image
 
 from .server import mcp  # reuse the same FastMCP instance
 from .server import db_manager  # database manager for fetching names
+from .person_cache import cached_person_lookup, invalidate_person_caches
 from memory_database.utils.identity_resolver import resolve_person_selector
 from memory_database.models import IdentityClaim, Principal
-from memory_database.utils.normalization import normalize_identity_value
+from memory_database.utils.normalization import normalize_identity_values
 
 logger = structlog.get_logger()
 
@@ -45,6 +55,195 @@ except Exception as e:  # pragma: no cover - environment-dependent
     PHOTOS_AVAILABLE = False
     PHOTOS_IMPORT_ERROR = str(e)
 
+VIPS_AVAILABLE = False
+
+try:  # optional; without it HEIC originals are viewed as their raw bytes
+    import pyvips  # type: ignore
+
+    VIPS_AVAILABLE = True
+except Exception:  # pragma: no cover - environment-dependent
+    VIPS_AVAILABLE = False
+
+
+# -------- PhotosDB cache ---------
+
+@dataclass
+class _PhotosLibrary:
+    """An opened PhotosDB plus the Photos.sqlite mtime it was loaded at."""
+
+    db: "PhotosDB"
+    mtime: Optional[float] = None
+    _uuid_to_name: Optional[Dict[str, str]] = None
+    _persons_lc: Optional[List[Tuple[str, str]]] = None
+    _date_index: Optional[Tuple[List[_dt.datetime], List[str]]] = None
+    # photo uuid -> chosen JPEG preview derivative (None when it has none)
+    preview_paths: Dict[str, Optional[str]] = field(default_factory=dict)
+
+    @property
+    def uuid_to_name(self) -> Dict[str, str]:
+        """Photos person uuid -> People label, built on first use."""
+        if self._uuid_to_name is None:
+            pi_list = getattr(self.db, "person_info", []) or []
+            self._uuid_to_name = {getattr(pi, "uuid", None): getattr(pi, "name", None) for pi in pi_list}
+        return self._uuid_to_name
+
+    @property
+    def persons_lc(self) -> List[Tuple[str, str]]:
+        """(lowercased name, name) pairs for substring matching People labels."""
+        if self._persons_lc is None:
+            known = getattr(self.db, "persons", []) or []
+            self._persons_lc = [(n.lower(), n) for n in known]
+        return self._persons_lc
+
+    @property
+    def date_index(self) -> Tuple[List[_dt.datetime], List[str]]:
+        """Parallel (local-time photo date, uuid) lists sorted by date, for bisecting date windows."""
+        if self._date_index is None:
+            pairs = sorted((p.date.astimezone(), p.uuid) for p in self.db.photos())
+            self._date_index = ([d for d, _ in pairs], [u for _, u in pairs])
+        return self._date_index
+
+    def uuids_between(self, start: Optional[_dt.datetime], end: Optional[_dt.datetime]) -> List[str]:
+        """
+        UUIDs of photos dated within [start, end].
+
+        Matches osxphotos' from_date/to_date: photo dates are compared as
+        instants, whatever zone they were taken in, and naive bounds are
+        taken as local time.
+        """
+        dates, uuids = self.date_index
+        lo = bisect.bisect_left(dates, start.astimezone()) if start else 0
+        hi = bisect.bisect_right(dates, end.astimezone()) if end else len(dates)
+        return uuids[lo:hi]
+
+
+_PHOTOS_LIBRARY: Optional[_PhotosLibrary] = None
+_EXPORT_WORKERS = 8
+_PHOTOS_LIBRARY_LOCK = threading.Lock()
+
+
+# File extension -> format string expected by FastMCP Image (without 'image/' prefix)
+_EXT_TO_FORMAT = {
+    '.jpg': 'jpeg',
+    '.jpeg': 'jpeg',
+    '.png': 'png',
+    '.gif': 'gif',
+    '.webp': 'webp',
+    '.heic': 'jpeg',  # HEIC will be converted or we use JPEG derivative
+}
+
+
+def _first_jpeg(paths: List[str]) -> Optional[str]:
+    """First JPEG path in a path_derivatives list, None if there is none."""
+    return next((d for d in paths if d.lower().endswith(('.jpeg', '.jpg'))), None)
+
+
+def _preview_path(p: "PhotoInfo") -> Optional[str]:
+    """
+    First JPEG preview derivative of a photo, or None.
+
+    osxphotos lists the derivatives directory on every path_derivatives
+    access, so the pick is remembered per photo on the cached library
+    (dropped with it when Photos.sqlite changes).
+    """
+    library = _PHOTOS_LIBRARY
+    cache = library.preview_paths if library is not None else None
+    if cache is not None and p.uuid in cache:
+        return cache[p.uuid]
+    derivatives = getattr(p, 'path_derivatives', None)
+    path = _first_jpeg(derivatives) if derivatives and isinstance(derivatives, list) else None
+    if cache is not None:
+        cache[p.uuid] = path
+    return path
+
+
+def _library_mtime(db: Any) -> Optional[float]:
+    """Latest mtime of the library's Photos.sqlite (or its WAL), None if unreadable."""
+    library_path = getattr(db, "library_path", None)
+    if not isinstance(library_path, str):
+        return None
+    sqlite_path = os.path.join(library_path, "database", "Photos.sqlite")
+    try:
+        mtime = os.stat(sqlite_path).st_mtime
+    except OSError:
+        return None
+    try:
+        mtime = max(mtime, os.stat(sqlite_path + "-wal").st_mtime)
+    except OSError:
+        pass
+    return mtime
+
+
+def _get_photos_library() -> _PhotosLibrary:
+    """
+    Return the opened Photos library, reusing it while Photos.sqlite is unchanged.
+
+    Opening PhotosDB parses the whole library, so it is kept across tool calls
+    and rebuilt only when the database file changes. Libraries whose database
+    file can't be located are opened fresh on every call.
+    """
+    global _PHOTOS_LIBRARY
+    with _PHOTOS_LIBRARY_LOCK:
+        cached = _PHOTOS_LIBRARY
+        if cached is not None and _library_mtime(cached.db) == cached.mtime:
+            return cached
+        db = PhotosDB()
+        library = _PhotosLibrary(db=db, mtime=_library_mtime(db))
+        _PHOTOS_LIBRARY = library if library.mtime is not None else None
+        return library
+
+
+def _get_photos_db() -> "PhotosDB":
+    return _get_photos_library().db
+
+
+# -------- Person resolution cache ---------
+
+# Resolved selectors are reused for at most this long (seconds)
+_PERSON_CACHE_TTL = 300
+
+
+@cached_person_lookup(ttl=_PERSON_CACHE_TTL, maxsize=256)
+def _resolve_person_cached(
+    selector_key: str,
+) -> Optional[Tuple[str, Optional[str], Optional[str], Tuple[str, ...]]]:
+    """
+    Resolve a JSON person selector to (principal_id, display_name, photos person_uuid, candidate names).
+
+    Returns None when no principal matches; misses aren't cached.
+    """
+    with db_manager.get_session() as _session:  # type: ignore[attr-defined]
+        principal = resolve_person_selector(_session, _json.loads(selector_key))
+        if not principal:
+            return None
+        # Check for Photos link (person_uuid)
+        claim = (
+            _session.query(IdentityClaim)
+            .filter(
+                IdentityClaim.principal_id == principal.id,
+                IdentityClaim.platform == "photos",
+                IdentityClaim.kind == "person_uuid",
+            )
+            .first()
+        )
+        if claim:
+            return principal.id, principal.display_name, claim.value, ()
+        # Build heuristic candidates from display_name + alias claims
+        candidate_names: List[str] = []
+        if getattr(principal, "display_name", None):
+            candidate_names.append(principal.display_name)
+        claims = list(getattr(principal, "identity_claims", []) or [])
+        if not claims:
+            claims = (
+                _session.query(IdentityClaim)
+                .filter(IdentityClaim.principal_id == principal.id)
+                .all()
+            )
+        for c in claims:
+            if c.kind in ("display_name", "alias") and c.value:
+                candidate_names.append(c.value)
+        return principal.id, principal.display_name, None, tuple(dict.fromkeys(candidate_names))
+
 
 # -------- Helpers ---------
 
@@ -66,9 +265,39 @@ def _parse_date(date_str: Optional[str], *, is_end: bool = False) -> Optional[_d
         raise ValueError(f"Invalid date format: {date_str}; use YYYY-MM-DD or ISO 8601")
 
 
-def _safe_photo_fields(p: "PhotoInfo") -> Dict[str, Any]:
-    # Gather commonly useful fields, handling None safely
-    loc = p.location  # (lat, lon) tuple or None
+# PhotoInfo attributes copied into search results, fetched as one tuple
+_PHOTO_FIELDS = (
+    "uuid", "date", "date_modified", "hasadjustments", "uti", "favorite", "hidden",
+    "albums", "keywords", "persons", "labels", "location", "path", "path_edited",
+)
+_get_photo_fields = operator.attrgetter(*_PHOTO_FIELDS)
+
+
+def _cached_isoformat(value: Optional[_dt.datetime], cache: Optional[Dict[Any, str]]) -> Optional[str]:
+    """value.isoformat(), reusing strings for timestamps already seen in this request."""
+    if not value:
+        return None
+    if cache is None:
+        return value.isoformat()
+    # Aware datetimes compare equal across offsets; keep the offset in the key
+    key = (value, value.utcoffset())
+    iso = cache.get(key)
+    if iso is None:
+        iso = cache[key] = value.isoformat()
+    return iso
+
+
+def _safe_photo_fields(p: "PhotoInfo", iso_cache: Optional[Dict[Any, str]] = None) -> Dict[str, Any]:
+    # Gather commonly useful fields, handling None safely. attrgetter reads them
+    # all in one C call; fall back to per-field defaults if any are missing
+    try:
+        fields = _get_photo_fields(p)
+    except AttributeError:
+        fields = tuple(getattr(p, name, None) for name in _PHOTO_FIELDS)
+    (uuid, created, modified, hasadjustments, uti, favorite, hidden,
+     albums, keywords, persons, labels, loc, path, path_edited) = fields
+
+    # loc is a (lat, lon) tuple or None
     lat, lon = (loc[0], loc[1]) if loc else (None, None)
     # place info: osxphotos provides place_name and place fields
     try:
@@ -84,35 +313,43 @@ def _safe_photo_fields(p: "PhotoInfo") -> Dict[str, Any]:
             place_name = str(place)
 
     return {
-        "uuid": p.uuid,
-        "created": p.date.isoformat() if getattr(p, "date", None) else None,
-        "modified": p.date_modified.isoformat() if getattr(p, "date_modified", None) else None,
-        "is_edited": bool(getattr(p, "hasadjustments", False)),
-        "media_type": getattr(p, "uti", None),
-        "favorite": bool(getattr(p, "favorite", False)),
-        "hidden": bool(getattr(p, "hidden", False)),
-        "albums": list(getattr(p, "albums", [])),
-        "keywords": list(getattr(p, "keywords", [])),
-        "persons": list(getattr(p, "persons", [])),
+        "uuid": uuid,
+        "created": _cached_isoformat(created, iso_cache),
+        "modified": _cached_isoformat(modified, iso_cache),
+        "is_edited": bool(hasadjustments),
+        "media_type": uti,
+        "favorite": bool(favorite),
+        "hidden": bool(hidden),
+        "albums": list(albums or ()),
+        "keywords": list(keywords or ()),
+        "persons": list(persons or ()),
         # persons_uuids may be filled in later if include_faces is requested
-        "labels": list(getattr(p, "labels", [])),  # ML scene/object labels
+        "labels": list(labels or ()),  # ML scene/object labels
         "lat": lat,
         "lon": lon,
         "place": place_name,
-        "original_path": getattr(p, "path", None),
-        "edited_path": getattr(p, "path_edited", None),
+        "original_path": path,
+        "edited_path": path_edited,
     }
 
 
+# Set once the library has opened successfully; failures are re-checked every call
+_FDA_OK = False
+
+
 def _require_photos() -> Tuple[bool, Optional[str]]:
+    global _FDA_OK
     if not PHOTOS_AVAILABLE:
         return False, (
             "osxphotos not available. Install dependency and grant Full Disk Access. "
             f"Import error: {PHOTOS_IMPORT_ERROR}"
         )
+    if _FDA_OK:
+        return True, None
     # Try opening the DB to surface FDA issues quickly
     try:
-        _ = PhotosDB()
+        _get_photos_library()
+        _FDA_OK = True
         return True, None
     except Exception as e:
         return False, (
@@ -122,6 +359,23 @@ def _require_photos() -> Tuple[bool, Optional[str]]:
 
 
 # Tolerant parsers for common input mistakes (stringified arrays/objects, CSV, single strings)
+
+# First characters a JSON document can start with; anything else skips the parser
+_JSON_START = frozenset('[{"-0123456789tfnNI')
+_NOT_JSON = object()
+
+
+def _try_json(s: str) -> Any:
+    """json.loads(s), or _NOT_JSON if s isn't valid JSON."""
+    # Most inputs are plain names or CSV; don't pay for a raised JSONDecodeError
+    if s[:1] not in _JSON_START:
+        return _NOT_JSON
+    try:
+        return _json.loads(s)
+    except Exception:
+        return _NOT_JSON
+
+
 def _parse_listish(value: Optional[Union[List[str], str]]) -> Optional[List[str]]:
     if value is None:
         return None
@@ -130,14 +384,11 @@ def _parse_listish(value: Optional[Union[List[str], str]]) -> Optional[List[str]
     if isinstance(value, str):
         s = value.strip()
         # Try JSON first
-        try:
-            loaded = _json.loads(s)
-            if isinstance(loaded, list):
-                return [str(x) for x in loaded if isinstance(x, (str, int, float)) and str(x).strip()]
-            if isinstance(loaded, (str, int, float)) and str(loaded).strip():
-                return [str(loaded)]
-        except Exception:
-            pass
+        loaded = _try_json(s)
+        if isinstance(loaded, list):
+            return [str(x) for x in loaded if isinstance(x, (str, int, float)) and str(x).strip()]
+        if isinstance(loaded, (str, int, float)) and str(loaded).strip():
+            return [str(loaded)]
         # Fallback: CSV or single token
         if "," in s:
             return [part.strip() for part in s.split(",") if part.strip()]
@@ -153,11 +404,10 @@ def _parse_objectish(value: Optional[Union[Dict[str, Any], str]]) -> Optional[Di
         return value
     if isinstance(value, str):
         s = value.strip()
-        try:
-            loaded = _json.loads(s)
-            if isinstance(loaded, dict):
-                return loaded
-        except Exception:
+        loaded = _try_json(s)
+        if isinstance(loaded, dict):
+            return loaded
+        if loaded is _NOT_JSON:
             # Not JSON; treat as a bare name/email/phone and wrap
             if s:
                 # Heuristic: very simple patterns
@@ -169,6 +419,62 @@ def _parse_objectish(value: Optional[Union[Dict[str, Any], str]]) -> Optional[Di
     return None
 
 
+# Photos People labels that name nobody and are never linked
+_PLACEHOLDER_LABELS = frozenset({"unknown", "no name"})
+
+
+def _prefetch_people_matches(
+    session: Any, labels: List[str], label_norms: List[str], norm_uuids: List[str]
+) -> Tuple[Dict[str, IdentityClaim], Dict[str, Principal], Dict[str, Principal]]:
+    """
+    Bulk-load the exact matches photos_ingest_people_links tries for each Photos person.
+
+    label_norms and norm_uuids are the labels and person uuids already run
+    through alias and person_uuid normalization.
+
+    Returns (existing person_uuid claim by normalized uuid, principal by
+    lowercased display_name, principal by normalized display_name/alias claim),
+    each keeping the first row seen per key.
+    """
+    existing_by_uuid: Dict[str, IdentityClaim] = {}
+    norm_uuids = set(norm_uuids) - {""}
+    if norm_uuids:
+        for claim in (
+            session.query(IdentityClaim)
+            .filter(
+                IdentityClaim.platform == "photos",
+                IdentityClaim.kind == "person_uuid",
+                IdentityClaim.normalized.in_(norm_uuids),
+            )
+            .yield_per(1000)
+        ):
+            existing_by_uuid.setdefault(claim.normalized, claim)
+
+    by_display_name: Dict[str, Principal] = {}
+    lowered = {label.lower() for label in labels}
+    if lowered:
+        query = session.query(Principal).filter(func.lower(Principal.display_name).in_(lowered))
+        for principal in query.yield_per(1000):
+            by_display_name.setdefault(principal.display_name.lower(), principal)
+
+    by_claim: Dict[str, Principal] = {}
+    label_norms = set(label_norms) - {""}
+    if label_norms:
+        rows = (
+            session.query(IdentityClaim.normalized, Principal)
+            .join(Principal, Principal.id == IdentityClaim.principal_id)
+            .filter(
+                IdentityClaim.kind.in_(["display_name", "alias"]),
+                IdentityClaim.normalized.in_(label_norms),
+            )
+            .yield_per(1000)
+        )
+        for normalized, principal in rows:
+            by_claim.setdefault(normalized, principal)
+
+    return existing_by_uuid, by_display_name, by_claim
+
+
 # -------- MCP Tools ---------
 
 @mcp.tool
@@ -314,7 +620,8 @@ def photos_search(
         return {"error": str(e), "photos": [], "total_found": 0}
 
     try:
-        db = PhotosDB()
+        library = _get_photos_library()
+        db = library.db
         # Build filters using current osxphotos signature (persons, albums, keywords, from_date, to_date)
         query_kwargs: Dict[str, Any] = {}
         # Asset UUID filtering
@@ -325,7 +632,6 @@ def photos_search(
         desired_names: List[str] = []
 
         # Unified person resolution and Photos linkage
-        resolved_principal: Optional[Principal] = None
         person_resolution: Dict[str, Any] = {
             "status": "unresolved",
             "principal": None,
@@ -338,54 +644,25 @@ def photos_search(
 
         if person:
             try:
-                with db_manager.get_session() as _session:  # type: ignore[attr-defined]
-                    resolved_principal = resolve_person_selector(_session, person)
-                    if resolved_principal:
-                        person_resolution["principal"] = {
-                            "id": resolved_principal.id,
-                            "display_name": resolved_principal.display_name,
-                        }
-                        # Check for Photos link (person_uuid)
-                        claim = (
-                            _session.query(IdentityClaim)
-                            .filter(
-                                IdentityClaim.principal_id == resolved_principal.id,
-                                IdentityClaim.platform == "photos",
-                                IdentityClaim.kind == "person_uuid",
-                            )
-                            .first()
-                        )
-                        if claim:
-                            photos_person_uuid = claim.value
-                            person_resolution["photos_link"] = {"person_uuid": claim.value}
-                            person_resolution["status"] = "linked"
-                        else:
-                            # Build heuristic candidates from display_name + alias claims
-                            candidate_names: List[str] = []
-                            if getattr(resolved_principal, "display_name", None):
-                                candidate_names.append(resolved_principal.display_name)
-                            claims = list(getattr(resolved_principal, "identity_claims", []) or [])
-                            if not claims:
-                                claims = (
-                                    _session.query(IdentityClaim)
-                                    .filter(IdentityClaim.principal_id == resolved_principal.id)
-                                    .all()
-                                )
-                            for c in claims:
-                                if c.kind in ("display_name", "alias") and c.value:
-                                    candidate_names.append(c.value)
-                            desired_names.extend(sorted(set(candidate_names)))
-                            person_resolution["candidates"] = sorted(set(candidate_names))
-                            person_resolution["status"] = "heuristic"
+                resolved = _resolve_person_cached(_json.dumps(person, sort_keys=True, default=str))
+                if resolved:
+                    principal_id, display_name, linked_uuid, candidates = resolved
+                    person_resolution["principal"] = {"id": principal_id, "display_name": display_name}
+                    if linked_uuid:
+                        photos_person_uuid = linked_uuid
+                        person_resolution["photos_link"] = {"person_uuid": linked_uuid}
+                        person_resolution["status"] = "linked"
+                    else:
+                        desired_names.extend(candidates)
+                        person_resolution["candidates"] = list(candidates)
+                        person_resolution["status"] = "heuristic"
             except Exception as _e:
                 logger.warning("person resolution failed", error=str(_e))
 
         # If Photos link exists, translate person_uuid to the Photos People name
         if photos_person_uuid:
             try:
-                pi_list = getattr(db, "person_info", []) or []
-                uuid_to_name = {getattr(pi, "uuid", None): getattr(pi, "name", None) for pi in pi_list}
-                linked_name = uuid_to_name.get(photos_person_uuid)
+                linked_name = library.uuid_to_name.get(photos_person_uuid)
                 if linked_name:
                     desired_names.append(linked_name)
                     person_resolution["used_names"] = [linked_name]
@@ -395,12 +672,11 @@ def photos_search(
         # 2) Include explicit people arg
         if people:
             try:
-                known = getattr(db, "persons", []) or []
+                persons_lc = library.persons_lc
                 expanded: List[str] = []
-                for q in people:
-                    ql = q.lower()
-                    expanded.extend([n for n in known if ql in n.lower()])
-                expanded = sorted(set(expanded)) or list(people)
+                for ql in (q.lower() for q in people):
+                    expanded.extend(n for n_lc, n in persons_lc if ql in n_lc)
+                expanded = list(dict.fromkeys(expanded)) or list(people)
                 desired_names.extend(expanded)
             except Exception:
                 desired_names.extend(list(people))
@@ -409,8 +685,7 @@ def photos_search(
         
         if person_uuids:
             try:
-                pi_list = getattr(db, "person_info", []) or []
-                uuid_to_name = {getattr(pi, "uuid", None): getattr(pi, "name", None) for pi in pi_list}
+                uuid_to_name = library.uuid_to_name
                 for pu in person_uuids:
                     name = uuid_to_name.get(pu)
                     if name:
@@ -419,7 +694,7 @@ def photos_search(
                 pass
 
         if desired_names:
-            query_kwargs["persons"] = sorted(set(desired_names))
+            query_kwargs["persons"] = list(dict.fromkeys(desired_names))
         if albums:
             query_kwargs["albums"] = list(albums)
         if keywords:
@@ -429,45 +704,59 @@ def photos_search(
         if end:
             query_kwargs["to_date"] = end
 
-        photos = db.photos(**query_kwargs)  # type: ignore[arg-type]
-        if limit and len(photos) > limit:
-            photos = photos[:limit]
+        # A date-only window on a cached library is answered from its sorted
+        # date index instead of osxphotos comparing every asset's date. The
+        # photos still come from osxphotos, in its order, before `limit` applies
+        date_only = bool(query_kwargs) and query_kwargs.keys() <= {"from_date", "to_date"}
+        if date_only and library.mtime is not None:
+            window = library.uuids_between(start, end)
+            photos = db.photos(uuid=window) if window else []  # type: ignore[arg-type]
+        else:
+            photos = db.photos(**query_kwargs)  # type: ignore[arg-type]
 
         # Apply additional in-Python filters for place and labels, not supported as query args in this osxphotos version
+        place_lc = place.lower() if place else None
+
         def _match_place(p: "PhotoInfo") -> bool:
-            if not place:
+            if place_lc is None:
                 return True
             try:
                 pl = getattr(p, "place", None)
                 if pl is None:
                     return False
-                text = None
                 # try to get a readable name if available
                 name = getattr(pl, "name", None)
-                if name:
-                    text = str(name)
-                else:
-                    text = str(pl)
-                return place.lower() in text.lower()
+                text = str(name) if name else str(pl)
+                return place_lc in text.lower()
             except Exception:
                 return False
 
+        labels_set = frozenset(labels or ())
+        # The usual single-label filter is a plain membership test; issubset
+        # would build a set from every photo's label list first
+        single_label = next(iter(labels_set)) if len(labels_set) == 1 else None
+
         def _match_labels(p: "PhotoInfo") -> bool:
-            if not labels:
+            if not labels_set:
                 return True
             try:
-                plabels = set(getattr(p, "labels", []) or [])
-                return all(l in plabels for l in labels)
+                plabels = getattr(p, "labels", None) or ()
+                if single_label is not None:
+                    return single_label in plabels
+                return labels_set.issubset(plabels)
             except Exception:
                 return False
 
-        filtered = [p for p in photos if _match_place(p) and _match_labels(p)]
-        if limit and len(filtered) > limit:
-            filtered = filtered[:limit]
+        # Stop filtering as soon as `limit` matches are found
+        filtered = list(islice((p for p in photos if _match_place(p) and _match_labels(p)), limit or None))
 
         results = []
+        # Burst shots and bulk edits share timestamps; encode each one once
+        iso_cache: Dict[Any, str] = {}
+        # Faces with a Photos person_uuid, mapped back to Principals in one query below
+        linked_faces: List[Dict[str, Any]] = []
         for p in filtered:
-            item = _safe_photo_fields(p)
+            item = _safe_photo_fields(p, iso_cache)
             if include_faces:
                 faces = []
                 person_uuids_set = set()
@@ -476,12 +765,14 @@ def photos_search(
                     for fi in fi_list:
                         try:
                             bbox = None
-                            if hasattr(fi, "bbox") and fi.bbox:
-                                bbox = [fi.bbox[0], fi.bbox[1], fi.bbox[2], fi.bbox[3]]
-                            elif hasattr(fi, "center") and hasattr(fi, "width") and hasattr(fi, "height"):
-                                cx, cy = fi.center if isinstance(fi.center, tuple) else (None, None)
+                            bbox_val = getattr(fi, "bbox", None)
+                            if bbox_val:
+                                bbox = [bbox_val[0], bbox_val[1], bbox_val[2], bbox_val[3]]
+                            else:
+                                center = getattr(fi, "center", None)
                                 w = getattr(fi, "width", None)
                                 h = getattr(fi, "height", None)
+                                cx, cy = center if isinstance(center, tuple) else (None, None)
                                 if cx is not None and cy is not None and w and h:
                                     bbox = [max(0.0, cx - w / 2), max(0.0, cy - h / 2), w, h]
                             # Try to resolve person uuid from face's person_info, if named
@@ -502,26 +793,8 @@ def photos_search(
                                 "bbox": bbox,
                             }
 
-                            # If this face has a person_uuid, try mapping back to a Principal
                             if person_uuid:
-                                try:
-                                    with db_manager.get_session() as _session:  # type: ignore[attr-defined]
-                                        claim = (
-                                            _session.query(IdentityClaim)
-                                            .filter(
-                                                IdentityClaim.platform == "photos",
-                                                IdentityClaim.kind == "person_uuid",
-                                                IdentityClaim.normalized == person_uuid.lower().strip(),
-                                            )
-                                            .first()
-                                        )
-                                        if claim:
-                                            pr = _session.query(Principal).get(claim.principal_id)
-                                            if pr:
-                                                face_entry["principal_id"] = pr.id
-                                                face_entry["principal_display_name"] = pr.display_name
-                                except Exception:
-                                    pass
+                                linked_faces.append(face_entry)
 
                             faces.append(face_entry)
                         except Exception:
@@ -530,9 +803,34 @@ def photos_search(
                     faces = []
                 item["faces"] = faces
                 if person_uuids_set:
-                    item["person_uuids"] = sorted(list(person_uuids_set))
+                    item["person_uuids"] = sorted(person_uuids_set)
             results.append(item)
 
+        # Map face person_uuids back to Principals
+        if linked_faces:
+            try:
+                wanted = {f["person_uuid"].lower().strip() for f in linked_faces}
+                with db_manager.get_session() as _session:  # type: ignore[attr-defined]
+                    rows = (
+                        _session.query(IdentityClaim.normalized, Principal.id, Principal.display_name)
+                        .join(Principal, Principal.id == IdentityClaim.principal_id)
+                        .filter(
+                            IdentityClaim.platform == "photos",
+                            IdentityClaim.kind == "person_uuid",
+                            IdentityClaim.normalized.in_(wanted),
+                        )
+                        .all()
+                    )
+                uuid_to_principal: Dict[str, Tuple[str, Optional[str]]] = {}
+                for normalized, principal_id, display_name in rows:
+                    uuid_to_principal.setdefault(normalized, (principal_id, display_name))
+                for face_entry in linked_faces:
+                    hit = uuid_to_principal.get(face_entry["person_uuid"].lower().strip())
+                    if hit:
+                        face_entry["principal_id"], face_entry["principal_display_name"] = hit
+            except Exception:
+                pass
+
         # Report criteria we actually used
         crit = dict(query_kwargs)
         if place:
@@ -552,6 +850,7 @@ def photos_export(
     destination_dir: Optional[str] = None,
     use_preview: bool = True,
     overwrite: bool = False,
+    preserve_metadata: bool = False,
 ) -> Dict[str, Any]:
     """
     Export photos from Photos library to disk by UUID.
@@ -592,6 +891,7 @@ def photos_export(
         destination_dir: Target directory path. If not provided, creates a temp directory
         use_preview: Export Photos previews (fast, smaller) vs originals (slow, full quality)
         overwrite: Whether to overwrite existing files with same name
+        preserve_metadata: Also copy file timestamps and permission bits from the source
 
     Returns:
         Dictionary containing:
@@ -614,53 +914,68 @@ def photos_export(
     os.makedirs(dest_dir, exist_ok=True)
 
     try:
-        db = PhotosDB()
+        db = _get_photos_db()
         photos = db.photos(uuid=uuids)  # type: ignore[arg-type]
         exported: List[str] = []
         failed: Dict[str, str] = {}
+        # Filenames already in the destination or picked by a worker; listed
+        # once so the rename loop below probes memory instead of the filesystem
+        claimed: Set[str] = set() if overwrite else set(os.listdir(dest_dir))
+        claim_lock = threading.Lock()
 
-        for p in photos:
-            try:
-                source_path = None
-
-                if use_preview:
-                    # Use Photos-generated preview derivatives
-                    derivatives = getattr(p, 'path_derivatives', None)
-                    if derivatives and isinstance(derivatives, list):
-                        jpeg_derivatives = [d for d in derivatives if d.lower().endswith(('.jpeg', '.jpg'))]
-                        if jpeg_derivatives:
-                            source_path = jpeg_derivatives[0]
-
-                # Fallback to edited or original
-                if not source_path:
-                    source_path = getattr(p, 'path_edited', None) or getattr(p, 'path', None)
-
-                if not source_path or not os.path.exists(source_path):
-                    failed[p.uuid] = "No accessible file path found"
-                    continue
-
-                # Construct destination filename
-                file_ext = os.path.splitext(source_path)[1]
-                dest_filename = f"{p.uuid}{file_ext}"
-                dest_path = os.path.join(dest_dir, dest_filename)
-
-                # Check if file exists and overwrite settings
-                if os.path.exists(dest_path) and not overwrite:
+        def _export_one(p: "PhotoInfo") -> str:
+            source_path = None
+
+            if use_preview:
+                # Use Photos-generated preview derivatives
+                source_path = _preview_path(p)
+
+            # Fallback to edited or original
+            if not source_path:
+                source_path = getattr(p, 'path_edited', None) or getattr(p, 'path', None)
+
+            if not source_path:
+                raise FileNotFoundError("No accessible file path found")
+
+            # Construct destination filename
+            file_ext = os.path.splitext(source_path)[1]
+            dest_filename = f"{p.uuid}{file_ext}"
+
+            # Check if file exists and overwrite settings; pick the name under
+            # the lock so concurrent exports can't choose the same one
+            if not overwrite:
+                with claim_lock:
                     # Increment filename
                     base_name = p.uuid
                     counter = 1
-                    while os.path.exists(dest_path):
+                    while dest_filename in claimed:
                         dest_filename = f"{base_name}_{counter}{file_ext}"
-                        dest_path = os.path.join(dest_dir, dest_filename)
                         counter += 1
+                    claimed.add(dest_filename)
+            dest_path = os.path.join(dest_dir, dest_filename)
 
-                # Copy the file
-                import shutil
-                shutil.copy2(source_path, dest_path)
-                exported.append(dest_path)
-
-            except Exception as ex:  # continue others
-                failed[p.uuid] = str(ex)
+            # copyfile uses the platform's in-kernel copy (sendfile/fcopyfile);
+            # copystat is an extra round of syscalls most callers don't need
+            # No exists() probe first; a missing source surfaces from the copy
+            try:
+                shutil.copyfile(source_path, dest_path)
+            except FileNotFoundError:
+                with claim_lock:
+                    claimed.discard(dest_filename)
+                raise FileNotFoundError("No accessible file path found") from None
+            if preserve_metadata:
+                shutil.copystat(source_path, dest_path)
+            return dest_path
+
+        if photos:
+            # Copies are I/O bound, so run them concurrently; results keep photo order
+            with ThreadPoolExecutor(max_workers=min(_EXPORT_WORKERS, len(photos))) as pool:
+                futures = [(p, pool.submit(_export_one, p)) for p in photos]
+                for p, future in futures:
+                    try:
+                        exported.append(future.result())
+                    except Exception as ex:  # continue others
+                        failed[p.uuid] = str(ex)
 
         return {
             "destination": dest_dir,
@@ -677,8 +992,84 @@ def photos_export(
         }
 
 
+def _heic_to_jpeg(file_path: str) -> bytes:
+    """Transcode a HEIC file to JPEG bytes in memory with libvips."""
+    image = pyvips.Image.new_from_file(file_path, access="sequential")
+    return image.write_to_buffer(".jpg[Q=85,optimize_coding,strip]")
+
+
+def _load_view_photo(p: "PhotoInfo", use_preview: bool) -> Optional[Tuple[str, bytes, str]]:
+    """Read one photo for view_photos as (uuid, bytes, format), None if it is skipped."""
+    try:
+        file_path = None
+
+        if use_preview:
+            # Use Photos-generated preview derivatives (faster, smaller)
+            # path_derivatives contains pre-generated JPEGs optimized by Photos;
+            # the first is typically the smaller preview
+            file_path = _preview_path(p)
+            if file_path:
+                logger.debug("Using derivative preview", path=file_path)
+
+        # Fallback to edited or original path if no preview found
+        if not file_path:
+            # Try edited version first, then original
+            file_path = getattr(p, 'path_edited', None) or getattr(p, 'path', None)
+            logger.debug("Using original/edited photo", path=file_path, uuid=p.uuid)
+
+        # Open first and size the open file: one lookup both proves the file
+        # is there and gives its size (a stat can itself pull from iCloud)
+        try:
+            f = open(file_path, 'rb', buffering=0) if file_path else None
+        except OSError:
+            f = None
+        if f is None:
+            logger.warning("No accessible file found for photo", uuid=p.uuid, path=file_path)
+            return None
+
+        with f:
+            # Check size before reading (warn if over 1MB for Claude Desktop)
+            size_mb = os.fstat(f.fileno()).st_size / (1024 * 1024)
+            if size_mb > 1.0:
+                logger.warning(
+                    "Image exceeds 1MB limit for Claude Desktop",
+                    uuid=p.uuid,
+                    size_mb=round(size_mb, 2),
+                    path=file_path
+                )
+                # Skip images over 1MB to avoid errors in Claude Desktop
+                return None
+
+            # Determine format from file extension for FastMCP Image
+            file_ext = os.path.splitext(file_path)[1].lower()
+            format_str = _EXT_TO_FORMAT.get(file_ext, 'jpeg')  # default to jpeg
+
+            if file_ext == '.heic' and VIPS_AVAILABLE:
+                # HEIC is sent as JPEG, so send real JPEG bytes; they are usually
+                # larger than the HEIC, so check the limit again
+                image_bytes = _heic_to_jpeg(file_path)
+                if len(image_bytes) > 1024 * 1024:
+                    logger.warning(
+                        "Image exceeds 1MB limit for Claude Desktop",
+                        uuid=p.uuid,
+                        size_mb=round(len(image_bytes) / (1024 * 1024), 2),
+                        path=file_path
+                    )
+                    return None
+            else:
+                # Read the file as bytes; Image takes them directly, no temp copy.
+                # Unbuffered: FileIO.readall sizes one bytes object from fstat
+                image_bytes = f.read()
+
+        return p.uuid, image_bytes, format_str
+
+    except Exception as ex:
+        logger.warning("Failed to view photo", uuid=p.uuid, error=str(ex))
+        return None
+
+
 @mcp.tool
-def view_photos(
+async def view_photos(
     uuids: List[str],
     use_preview: bool = True,
 ) -> List[Image]:
@@ -739,84 +1130,38 @@ def view_photos(
         - Each image must be under 1MB for Claude Desktop compatibility
         - Empty list returned if Photos library is unavailable
     """
-    ok, err = _require_photos()
+    # Opening the library (first call) and its queries block; keep them off the loop
+    ok, err = await asyncio.to_thread(_require_photos)
     if not ok:
         logger.error("Photos not available", error=err)
         return []
 
     try:
-        db = PhotosDB()
-        photos = db.photos(uuid=uuids)  # type: ignore[arg-type]
+        db = await asyncio.to_thread(_get_photos_db)
+        photos = await asyncio.to_thread(db.photos, uuid=uuids)  # type: ignore[arg-type]
         images: List[Image] = []
 
-        for p in photos:
-            try:
-                file_path = None
-
-                if use_preview:
-                    # Use Photos-generated preview derivatives (faster, smaller)
-                    # path_derivatives contains pre-generated JPEGs optimized by Photos
-                    derivatives = getattr(p, 'path_derivatives', None)
-                    if derivatives and isinstance(derivatives, list):
-                        # Use the first derivative (typically the smaller preview)
-                        # Derivatives are usually in order from smallest to largest
-                        jpeg_derivatives = [d for d in derivatives if d.lower().endswith('.jpeg') or d.lower().endswith('.jpg')]
-                        if jpeg_derivatives:
-                            file_path = jpeg_derivatives[0]
-                            logger.debug("Using derivative preview", path=file_path)
-
-                # Fallback to edited or original path if no preview found
-                if not file_path:
-                    # Try edited version first, then original
-                    file_path = getattr(p, 'path_edited', None) or getattr(p, 'path', None)
-                    logger.debug("Using original/edited photo", path=file_path, uuid=p.uuid)
-
-                if not file_path or not os.path.exists(file_path):
-                    logger.warning("No accessible file found for photo", uuid=p.uuid, path=file_path)
-                    continue
-
-                # Read the file as bytes
-                with open(file_path, 'rb') as f:
-                    image_bytes = f.read()
-
-                # Check size (warn if over 1MB for Claude Desktop)
-                size_mb = len(image_bytes) / (1024 * 1024)
-                if size_mb > 1.0:
-                    logger.warning(
-                        "Image exceeds 1MB limit for Claude Desktop",
-                        uuid=p.uuid,
-                        size_mb=round(size_mb, 2),
-                        path=file_path
-                    )
-                    # Skip images over 1MB to avoid errors in Claude Desktop
-                    continue
-
-                # Determine format from file extension for FastMCP Image
-                file_ext = os.path.splitext(file_path)[1].lower()
-                # Map to format string expected by FastMCP (without 'image/' prefix)
-                format_str = {
-                    '.jpg': 'jpeg',
-                    '.jpeg': 'jpeg',
-                    '.png': 'png',
-                    '.gif': 'gif',
-                    '.webp': 'webp',
-                    '.heic': 'jpeg',  # HEIC will be converted or we use JPEG derivative
-                }.get(file_ext, 'jpeg')  # default to jpeg
-
-                # Create Image object from bytes
-                img = Image(data=image_bytes, format=format_str)
-                images.append(img)
-
-                logger.debug(
-                    "Successfully loaded photo",
-                    uuid=p.uuid,
-                    size_kb=round(len(image_bytes) / 1024, 2),
-                    format=format_str
-                )
+        # Reads are latency bound (disk or iCloud); run each in a worker thread
+        # so they overlap and the event loop stays free for other tool calls.
+        # gather keeps the results in photo order
+        loaded = await asyncio.gather(
+            *(asyncio.to_thread(_load_view_photo, p, use_preview) for p in photos)
+        )
 
-            except Exception as ex:
-                logger.warning("Failed to view photo", uuid=p.uuid, error=str(ex))
+        for result in loaded:
+            if result is None:
                 continue
+            uuid, image_bytes, format_str = result
+
+            # Create Image object from bytes
+            images.append(Image(data=image_bytes, format=format_str))
+
+            logger.debug(
+                "Successfully loaded photo",
+                uuid=uuid,
+                size_kb=round(len(image_bytes) / 1024, 2),
+                format=format_str
+            )
 
         if not images:
             logger.warning("No photos successfully loaded", requested_count=len(uuids))
@@ -851,7 +1196,7 @@ def photos_get_person_link(
 
     try:
         person = _parse_objectish(person) or {}
-        _ = PhotosDB()  # Ensure Photos DB is accessible
+        _get_photos_db()  # Ensure Photos DB is accessible
         with db_manager.get_session() as session:  # type: ignore[attr-defined]
             principal = resolve_person_selector(session, person)
             if not principal:
@@ -894,12 +1239,10 @@ def photos_link_person(
         return {"success": False, "error": err}
 
     try:
-        db = PhotosDB()
+        library = _get_photos_library()
         # Validate the provided Photos person UUID exists (best-effort)
         try:
-            pi_list = getattr(db, "person_info", []) or []
-            valid_uuids = {getattr(pi, "uuid", None) for pi in pi_list}
-            if photos_person_uuid not in valid_uuids:
+            if photos_person_uuid not in library.uuid_to_name:
                 return {"success": False, "error": "photos person_uuid not found in library"}
         except Exception:
             pass
@@ -942,6 +1285,8 @@ def photos_link_person(
     except Exception as e:
         logger.warning("photos_link_person failed", error=str(e))
         return {"success": False, "error": str(e)}
+    finally:
+        invalidate_person_caches()
 
 
 @mcp.tool
@@ -971,20 +1316,16 @@ def photos_ingest_people_links(
         return {"success": False, "error": err}
 
     try:
-        db = PhotosDB()
-        # Build list of Photos People (uuid, name)
+        library = _get_photos_library()
+        db = library.db
+        # Build list of Photos People (uuid, name) from the cached person index
         people = []
         try:
-            pi_list = getattr(db, "person_info", []) or []
-            for pi in pi_list:
-                try:
-                    uuid = getattr(pi, "uuid", None)
-                    name = getattr(pi, "name", None)
-                except Exception:
-                    uuid = None
-                    name = None
-                if uuid and name:
-                    people.append({"uuid": uuid, "name": name})
+            people = [
+                {"uuid": uuid, "name": name}
+                for uuid, name in library.uuid_to_name.items()
+                if uuid and name
+            ]
         except Exception:
             # Fallback via db.persons if needed (names only)
             for name in getattr(db, "persons", []) or []:
@@ -1001,11 +1342,31 @@ def photos_ingest_people_links(
             "items": [],
         }
 
+        # One transaction for the whole run, committed when the session closes;
+        # each link is written in its own savepoint so a failure only undoes it
         with db_manager.get_session() as session:  # type: ignore[attr-defined]
-            for person_info in people:
+            # Normalize every label and uuid once, up front
+            label_norms = normalize_identity_values([p.get("name") for p in people], "alias")
+            norm_uuids = normalize_identity_values([p.get("uuid") for p in people], "person_uuid")
+
+            # Exact-match lookups for every linkable person in three queries;
+            # only labels these miss fall through to per-label searches below
+            linkable = [
+                i for i, p in enumerate(people)
+                if p.get("uuid") and p.get("name") and p["name"].lower().strip() not in _PLACEHOLDER_LABELS
+            ]
+            existing_by_uuid, by_display_name, by_claim = _prefetch_people_matches(
+                session,
+                [people[i]["name"] for i in linkable],
+                [label_norms[i] for i in linkable],
+                [norm_uuids[i] for i in linkable],
+            )
+
+            resolved_by_label: Dict[str, Optional[Principal]] = {}
+
+            for person_info, label_norm, norm_uuid in zip(people, label_norms, norm_uuids):
                 photos_uuid = person_info.get("uuid")
                 label = person_info.get("name") or ""
-                label_norm = normalize_identity_value(label, "alias") if label else ""
 
                 record = {
                     "photos_uuid": photos_uuid,
@@ -1019,7 +1380,7 @@ def photos_ingest_people_links(
 
                 try:
                     # Skip unnamed or placeholder labels
-                    if not label or label.lower().strip() in {"unknown", "no name"}:
+                    if not label or label.lower().strip() in _PLACEHOLDER_LABELS:
                         record["action"] = "skip_empty_label"
                         stats["items"].append(record)
                         continue
@@ -1030,43 +1391,25 @@ def photos_ingest_people_links(
                         stats["items"].append(record)
                         continue
 
-                    # Normalize UUID for comparisons
-                    norm_uuid = normalize_identity_value(photos_uuid, "person_uuid")
-
                     # Check if this photos_uuid is already linked to some Principal
-                    existing_claim = (
-                        session.query(IdentityClaim)
-                        .filter(
-                            IdentityClaim.platform == "photos",
-                            IdentityClaim.kind == "person_uuid",
-                            IdentityClaim.normalized == norm_uuid,
-                        )
-                        .first()
-                    )
+                    existing_claim = existing_by_uuid.get(norm_uuid)
 
                     # Resolution path: exact display_name
-                    principal = (
-                        session.query(Principal)
-                        .filter(Principal.display_name.ilike(label))
-                        .first()
-                    )
+                    principal = by_display_name.get(label.lower())
 
                     # Exact alias/display_name identity match
                     if not principal and label_norm:
-                        claim_match = (
-                            session.query(IdentityClaim)
-                            .filter(
-                                IdentityClaim.kind.in_(["display_name", "alias"]),
-                                IdentityClaim.normalized == label_norm,
-                            )
-                            .first()
-                        )
-                        if claim_match:
-                            principal = session.query(Principal).get(claim_match.principal_id)
+                        principal = by_claim.get(label_norm)
 
-                    # Fuzzy by name using our unified resolver
+                    # Fuzzy by name using our unified resolver; the lookup is
+                    # case-insensitive, so labels differing only in case share it
                     if not principal:
-                        principal = resolve_person_selector(session, {"name": label})
+                        resolve_key = label.lower()
+                        if resolve_key in resolved_by_label:
+                            principal = resolved_by_label[resolve_key]
+                        else:
+                            principal = resolve_person_selector(session, {"name": label})
+                            resolved_by_label[resolve_key] = principal
 
                     # If still not found, try a fuzzy sweep returning multiple
                     candidates = []
@@ -1080,7 +1423,7 @@ def photos_ingest_people_links(
                         )
                         if len(candidates) == 1:
                             cid = candidates[0]["id"]
-                            principal = session.query(Principal).get(cid)
+                            principal = session.get(Principal, cid)
 
                     if not principal:
                         record["action"] = "no_match"
@@ -1107,12 +1450,17 @@ def photos_ingest_people_links(
                             stats["items"].append(record)
                             continue
                         else:
-                            # Reassign the claim to the matched principal
-                            existing_claim.principal_id = principal.id
-                            record["action"] = "reassigned_conflict"
-                            if not dry_run:
-                                session.commit()
-                            stats["linked"] += 1
+                            # Reassign the claim to the matched principal, in its
+                            # own savepoint so a failure only loses this record
+                            try:
+                                with session.begin_nested():
+                                    existing_claim.principal_id = principal.id
+                            except SQLAlchemyError as ex:
+                                record["action"] = "reassign_failed"
+                                record["error"] = str(ex)
+                            else:
+                                record["action"] = "reassigned_conflict"
+                                stats["linked"] += 1
                             stats["items"].append(record)
                             continue
 
@@ -1127,6 +1475,7 @@ def photos_ingest_people_links(
                             value=photos_uuid,
                             platform="photos",
                             confidence=0.9,
+                            commit=False,
                         )
                         if not res.get("success"):
                             # Could be duplicate race or validation issue
@@ -1143,9 +1492,13 @@ def photos_ingest_people_links(
                                         value=label,
                                         platform="photos",
                                         confidence=0.6,
+                                        commit=False,
                                     )
                             except Exception:
                                 pass
+                            # Later people with the same label see the new alias
+                            if label_norm:
+                                by_claim.setdefault(label_norm, principal)
                     if record["action"] == "link_created" or record["action"] == "would_link":
                         stats["linked"] += 1
 
@@ -1161,3 +1514,6 @@ def photos_ingest_people_links(
     except Exception as e:
         logger.warning("photos_ingest_people_links failed", error=str(e))
         return {"success": False, "error": str(e)}
+    finally:
+        if not dry_run:
+            invalidate_person_caches()
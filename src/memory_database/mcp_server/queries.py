@@ -3,8 +3,8 @@ Database query functions for MCP server.
 """
 
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy.orm import Session, contains_eager, joinedload, noload, selectinload
+from sqlalchemy import and_, or_, func, desc, literal, select, text, tuple_, union_all
 from datetime import datetime
 import structlog
 
@@ -22,14 +22,24 @@ def search_people_by_identity(
     username: Optional[str] = None,
     contact_id: Optional[str] = None,
     fuzzy_match: bool = False,
-    limit: int = 10
+    limit: int = 10,
+    identity_kinds: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     Search for people using flexible identity criteria.
+
+    identity_kinds limits the identities returned per person to those kinds
+    (an empty list returns none); the other claims are never loaded.
     """
-    query = session.query(Principal).options(
-        joinedload(Principal.identity_claims)
-    )
+    if identity_kinds is None:
+        claims_loader = selectinload(Principal.identity_claims)
+    elif identity_kinds:
+        claims_loader = selectinload(
+            Principal.identity_claims.and_(IdentityClaim.kind.in_(identity_kinds))
+        )
+    else:
+        claims_loader = noload(Principal.identity_claims)
+    query = session.query(Principal).options(claims_loader)
     
     conditions = []
     
@@ -180,15 +190,14 @@ def find_person_by_any_identity(
                 )
             )
     
+    # A principal whose display_name matches outright wins over identity claims
+    by_display_name = None
     if person_name:
         normalized_name = normalize_identity_value(person_name, 'display_name')
         if normalized_name:
-            # Try both display_name and identity claims
-            principal_by_name = session.query(Principal).filter(
+            by_display_name = select(Principal.id, literal(0).label('rank')).where(
                 Principal.display_name.ilike(normalized_name)
-            ).first()
-            if principal_by_name:
-                return principal_by_name.id
+            )
             
             conditions.append(
                 and_(
@@ -200,9 +209,10 @@ def find_person_by_any_identity(
     if not conditions:
         return None
     
-    # Try to find by identity claims
-    claim = session.query(IdentityClaim).filter(or_(*conditions)).first()
-    return claim.principal_id if claim else None
+    # Both lookups in one round trip; rank keeps the display_name match first
+    by_claim = select(IdentityClaim.principal_id, literal(1).label('rank')).where(or_(*conditions))
+    stmt = union_all(by_display_name, by_claim) if by_display_name is not None else by_claim
+    return session.execute(stmt.order_by(text('rank')).limit(1)).scalar()
 
 
 def search_messages_for_person(
@@ -213,12 +223,31 @@ def search_messages_for_person(
     content_contains: Optional[str] = None,
     platform: Optional[str] = None,
     include_attachments: bool = False,
-    limit: int = 50
+    limit: int = 50,
+    before: Optional[str] = None,
+    before_id: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Search messages for a specific person with optional filters.
+
+    Results are newest first, ties on sent_at broken by id. To page back,
+    pass the sent_at and id of the last message of the previous page as
+    ``before`` and ``before_id``; the sent_at index then stops after
+    ``limit`` rows instead of skipping over earlier pages. ``before`` alone
+    keeps only strictly older messages.
     """
-    query = session.query(Message).join(PersonMessage).join(Thread).join(Channel)
+    query = (
+        session.query(Message)
+        .join(PersonMessage)
+        .join(Thread)
+        .join(Channel)
+        .options(
+            # Thread/channel come from the joins above; participants are loaded
+            # for the whole page in one extra query instead of per message
+            contains_eager(Message.thread).contains_eager(Thread.channel),
+            selectinload(Message.person_links).joinedload(PersonMessage.principal),
+        )
+    )
     
     if include_attachments:
         query = query.options(joinedload(Message.attachments))
@@ -241,6 +270,18 @@ def search_messages_for_person(
         except ValueError:
             logger.warning("Invalid date_to format", date_to=date_to)
     
+    # Keyset cursor: only messages after the previous page's last one in
+    # (sent_at, id) order, so messages sharing a timestamp aren't skipped
+    if before:
+        try:
+            before_dt = datetime.fromisoformat(before.replace('Z', '+00:00'))
+            if before_id:
+                query = query.filter(tuple_(Message.sent_at, Message.id) < (before_dt, before_id))
+            else:
+                query = query.filter(Message.sent_at < before_dt)
+        except ValueError:
+            logger.warning("Invalid before format", before=before)
+    
     # Content filter
     if content_contains:
         query = query.filter(Message.content.ilike(f'%{content_contains}%'))
@@ -250,39 +291,30 @@ def search_messages_for_person(
         query = query.filter(Channel.platform == platform)
     
     # Order by most recent first
-    query = query.order_by(desc(Message.sent_at))
+    query = query.order_by(desc(Message.sent_at), desc(Message.id))
     
     messages = query.limit(limit).all()
     
     # Format results
     results = []
     for message in messages:
-        # Get sender info
-        sender_link = session.query(PersonMessage).filter_by(
-            message_id=message.id, role='sender'
-        ).first()
-        
+        # Get sender and recipients info from the preloaded links
         sender_info = None
-        if sender_link:
-            sender = session.query(Principal).get(sender_link.principal_id)
-            if sender:
-                sender_info = {
-                    'id': sender.id,
-                    'display_name': sender.display_name
-                }
-        
-        # Get recipients info
-        recipient_links = session.query(PersonMessage).filter_by(
-            message_id=message.id, role='recipient'
-        ).all()
-        
         recipients = []
-        for link in recipient_links:
-            recipient = session.query(Principal).get(link.principal_id)
-            if recipient:
+        for link in message.person_links:
+            principal = link.principal
+            if not principal:
+                continue
+            if link.role == 'sender':
+                if sender_info is None:
+                    sender_info = {
+                        'id': principal.id,
+                        'display_name': principal.display_name
+                    }
+            elif link.role == 'recipient':
                 recipients.append({
-                    'id': recipient.id,
-                    'display_name': recipient.display_name
+                    'id': principal.id,
+                    'display_name': principal.display_name
                 })
         
         # Format attachments if requested
@@ -29,7 +29,10 @@ This server uses FastMCP with session-based protocol. Available transports:
 - http: For remote access (FastMCP's Streamable HTTP implementation)
 """
 
+import asyncio
+import functools
 import hmac
+import json
 import os
 from typing import Optional, List, Dict, Any
 import structlog
@@ -38,7 +41,9 @@ from fastmcp.server.auth.auth import AccessToken, TokenVerifier
 
 from memory_database.database.connection import DatabaseManager, DatabaseSettings
 from .queries import search_people_by_identity, find_person_by_any_identity, search_messages_for_person
+from .person_cache import cached_person_lookup, invalidate_person_caches
 from memory_database.utils.identity_resolver import resolve_person_selector
+from memory_database.utils.normalization import normalize_identity_value
 from .write_tools import (
     create_contact, 
     add_contact_identity, 
@@ -57,23 +62,27 @@ class _StaticTokenAuth(TokenVerifier):
     def __init__(self, token: str, resource_server_url: Optional[str] = None):
         super().__init__(resource_server_url=resource_server_url)
         self._expected_token = token.strip()
+        self._expected_token_bytes = self._expected_token.encode()
+        # Only this one token is ever accepted, so its AccessToken is built once
+        self._access_token = AccessToken(
+            token=self._expected_token,
+            client_id="memory-database-http",
+            scopes=["memory-database:full"],
+        )
 
     async def verify_token(self, token: str) -> Optional[AccessToken]:
         provided = token.strip()
-        if provided.lower().startswith("bearer "):
-            provided = provided[7:].strip()
+        # Check the scheme on the prefix alone rather than lowercasing the token
+        if provided[:7].lower() == "bearer ":
+            provided = provided[7:].lstrip()
 
         if not provided:
             return None
 
-        if not hmac.compare_digest(provided, self._expected_token):
+        if not hmac.compare_digest(provided.encode(), self._expected_token_bytes):
             return None
 
-        return AccessToken(
-            token=provided,
-            client_id="memory-database-http",
-            scopes=["memory-database:full"],
-        )
+        return self._access_token
 
 
 HTTP_AUTH_TOKEN = os.getenv("MEMORY_DB_HTTP_TOKEN")
@@ -92,6 +101,52 @@ mcp = FastMCP("memory-database", auth=auth_provider)
 # Initialize database
 db_manager = DatabaseManager(DatabaseSettings())
 
+# Tool bodies block on SQLAlchemy; run them in worker threads so concurrent
+# calls don't serialize on the event loop, at most one per pooled connection
+_DB_SLOTS = asyncio.Semaphore(getattr(db_manager.engine.pool, "size", lambda: 5)())
+
+
+def _threaded(fn):
+    """Register a blocking tool body as a coroutine that runs it in a worker thread."""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        async with _DB_SLOTS:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return wrapper
+
+
+# Person identifiers resolved by search_messages, reused across calls until
+# the TTL runs out or a contact write tool calls invalidate_person_caches()
+_RESOLVE_CACHE_TTL = 300
+
+
+@cached_person_lookup(ttl=_RESOLVE_CACHE_TTL, maxsize=1024)
+def _resolve_person_id_cached(
+    selector_key: Optional[str],
+    email: Optional[str],
+    phone: Optional[str],
+    name: Optional[str],
+) -> Optional[str]:
+    """
+    Principal id for a person selector, falling back to email/phone/name lookup.
+
+    The selector is passed as its JSON dump and the identifiers already
+    normalized, so equivalent spellings share an entry.
+    """
+    with db_manager.get_session() as session:
+        if selector_key:
+            principal = resolve_person_selector(session, json.loads(selector_key))
+            if principal:
+                return principal.id
+        return find_person_by_any_identity(
+            session=session,
+            person_email=email,
+            person_phone=phone,
+            person_name=name
+        )
+
+
 # Register additional tool modules (e.g., photos)
 try:
     # Importing registers tools on the same FastMCP instance
@@ -102,6 +157,7 @@ except Exception as _e:
 
 
 @mcp.tool
+@_threaded
 def search_person(
     phone: Optional[str] = None,
     email: Optional[str] = None,
@@ -164,24 +220,19 @@ def search_person(
                 username=username,
                 contact_id=contact_id,
                 fuzzy_match=fuzzy_match,
-                limit=limit
+                limit=limit,
+                # If not including all identities, only load the primary
+                # identity types that were searched
+                identity_kinds=None if include_all_identities else [
+                    kind for kind, searched in (
+                        ('phone', phone),
+                        ('email', email),
+                        ('display_name', name),
+                        ('username', username),
+                    ) if searched
+                ]
             )
             
-            # If not including all identities, simplify the response
-            if not include_all_identities:
-                for person in people:
-                    # Keep only the primary identity types that were searched
-                    simplified_identities = {}
-                    if phone and 'phone' in person['identities']:
-                        simplified_identities['phone'] = person['identities']['phone']
-                    if email and 'email' in person['identities']:
-                        simplified_identities['email'] = person['identities']['email']
-                    if name and 'display_name' in person['identities']:
-                        simplified_identities['display_name'] = person['identities']['display_name']
-                    if username and 'username' in person['identities']:
-                        simplified_identities['username'] = person['identities']['username']
-                    person['identities'] = simplified_identities
-            
             return {
                 'people': people,
                 'total_found': len(people),
@@ -205,6 +256,7 @@ def search_person(
 
 
 @mcp.tool
+@_threaded
 def search_messages(
     person_id: Optional[str] = None,
     person_email: Optional[str] = None,
@@ -216,7 +268,9 @@ def search_messages(
     content_contains: Optional[str] = None,
     platform: Optional[str] = None,
     include_attachments: bool = False,
-    limit: int = 50
+    limit: int = 50,
+    before: Optional[str] = None,
+    before_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Search through your complete communication history (iMessage, email) for a specific person.
@@ -245,6 +299,8 @@ def search_messages(
     - content_contains: Text to search for in message content
     - platform: Filter by platform ('email', 'imessage')
     - include_attachments: Include attachment information
+    - before/before_id: Page cursor; pass 'next_before' and 'next_before_id'
+      from the previous response
     
     Args:
         person_id: Direct person ID (most efficient, get from search_person)
@@ -257,36 +313,43 @@ def search_messages(
         platform: Platform filter ('email', 'imessage')
         include_attachments: Include attachment details
         limit: Maximum number of messages to return
+        before: Only return messages sent before this ISO timestamp
+        before_id: Id of the last message seen at 'before', so messages
+            sharing that timestamp aren't skipped
         
     Returns:
         Dictionary with 'messages' key containing message content, timestamps, 
-        sender/recipients, platform info, and optionally attachments
+        sender/recipients, platform info, and optionally attachments, plus
+        'next_before'/'next_before_id' for fetching the next (older) page when
+        one may exist
     """
     try:
+        # Resolve person ID if not provided directly (memoized, in its own session)
+        resolved_person_id = person_id or _resolve_person_id_cached(
+            json.dumps(person, sort_keys=True, default=str) if person else None,
+            normalize_identity_value(person_email, 'email') if person_email else None,
+            normalize_identity_value(person_phone, 'phone') if person_phone else None,
+            normalize_identity_value(person_name, 'display_name') if person_name else None,
+        )
+        
+        if not resolved_person_id:
+            return {
+                'error': 'Could not find person with provided identifiers',
+                'messages': [],
+                'total_found': 0,
+                'person_resolved': None
+            }
+        
         with db_manager.get_session() as session:
-            # Resolve person ID if not provided directly
-            resolved_person_id = person_id
-
-            if not resolved_person_id and person:
-                pr = resolve_person_selector(session, person)
-                if pr:
-                    resolved_person_id = pr.id
-
-            if not resolved_person_id:
-                resolved_person_id = find_person_by_any_identity(
-                    session=session,
-                    person_email=person_email,
-                    person_phone=person_phone,
-                    person_name=person_name
-                )
-            
-            if not resolved_person_id:
-                return {
-                    'error': 'Could not find person with provided identifiers',
-                    'messages': [],
-                    'total_found': 0,
-                    'person_resolved': None
-                }
+            # Get person info for context up front; an id that matches nobody
+            # has no messages to search. Only the columns reported are loaded
+            from memory_database.models import Principal
+            from sqlalchemy.orm import load_only
+            principal = session.get(
+                Principal,
+                resolved_person_id,
+                options=[load_only(Principal.id, Principal.display_name, Principal.org)],
+            )
             
             # Search messages for the resolved person
             messages = search_messages_for_person(
@@ -297,21 +360,23 @@ def search_messages(
                 content_contains=content_contains,
                 platform=platform,
                 include_attachments=include_attachments,
-                limit=limit
-            )
+                limit=limit,
+                before=before,
+                before_id=before_id
+            ) if principal else []
             
-            # Get person info for context
-            from memory_database.models import Principal
-            person = session.query(Principal).get(resolved_person_id)
             person_info = {
-                'id': person.id,
-                'display_name': person.display_name,
-                'org': person.org
-            } if person else None
+                'id': principal.id,
+                'display_name': principal.display_name,
+                'org': principal.org
+            } if principal else None
             
+            has_more = bool(limit) and len(messages) == limit
             return {
                 'messages': messages,
                 'total_found': len(messages),
+                'next_before': messages[-1]['sent_at'] if has_more else None,
+                'next_before_id': messages[-1]['id'] if has_more else None,
                 'person_resolved': person_info,
                 'search_criteria': {
                     'person_id': person_id,
@@ -322,7 +387,9 @@ def search_messages(
                     'date_to': date_to,
                     'content_contains': content_contains,
                     'platform': platform,
-                    'include_attachments': include_attachments
+                    'include_attachments': include_attachments,
+                    'before': before,
+                    'before_id': before_id
                 }
             }
     
@@ -337,6 +404,7 @@ def search_messages(
 
 
 @mcp.tool
+@_threaded
 def create_new_contact(
     display_name: str,
     identities: Optional[List[Dict[str, Any]]] = None,
@@ -387,9 +455,12 @@ def create_new_contact(
     except Exception as e:
         logger.error("Error creating contact", error=str(e))
         return {'success': False, 'error': f"Failed to create contact: {str(e)}"}
+    finally:
+        invalidate_person_caches()
 
 
 @mcp.tool
+@_threaded
 def add_identity_to_contact(
     person_id: str,
     kind: str,
@@ -437,9 +508,12 @@ def add_identity_to_contact(
     except Exception as e:
         logger.error("Error adding identity to contact", error=str(e))
         return {'success': False, 'error': f"Failed to add identity: {str(e)}"}
+    finally:
+        invalidate_person_caches()
 
 
-@mcp.tool 
+@mcp.tool
+@_threaded
 def update_identity_to_contact(
     person_id: str,
     identity_id: str,
@@ -476,9 +550,12 @@ def update_identity_to_contact(
     except Exception as e:
         logger.error("Error updating identity", error=str(e))
         return {'success': False, 'error': f"Failed to update identity: {str(e)}"}
+    finally:
+        invalidate_person_caches()
 
 
 @mcp.tool
+@_threaded
 def remove_identity_from_contact(
     person_id: str,
     identity_id: str
@@ -502,6 +579,8 @@ def remove_identity_from_contact(
     except Exception as e:
         logger.error("Error removing identity from contact", error=str(e))
         return {'success': False, 'error': f"Failed to remove identity: {str(e)}"}
+    finally:
+        invalidate_person_caches()
 
 
 # Identity types resource 
@@ -513,6 +592,12 @@ def get_identity_types_resource() -> str:
     Returns reference data for creating or updating contact identities.
     Shows valid values for 'kind' and 'platform' parameters.
     """
+    return _identity_types_json()
+
+
+@functools.cache
+def _identity_types_json() -> str:
+    """The identity_types resource body; static, so serialized once per process."""
     data = {
         'allowed_identity_kinds': sorted(list(ALLOWED_IDENTITY_KINDS)),
         'allowed_platforms': sorted(list(ALLOWED_PLATFORMS)),
@@ -549,7 +634,6 @@ def get_identity_types_resource() -> str:
         }
     }
     
-    import json
     return json.dumps(data, indent=2)
 
 
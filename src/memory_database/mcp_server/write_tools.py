@@ -22,6 +22,7 @@ from typing import Dict, List, Any, Optional
 from enum import Enum
 
 import structlog
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -214,53 +215,51 @@ def create_contact(
         session.add(principal)
         session.flush()  # Get the ID
         
-        # Add identity claims
+        # Validate all identity claims up front, then insert them in one statement.
+        # The principal is brand new, so the only possible (platform, normalized)
+        # collisions are within this batch.
         created_identities = []
-        if identities:
-            for identity in identities:
-                try:
-                    kind = validate_identity_kind(identity.get('kind', ''))
-                    platform = validate_platform(identity.get('platform', 'manual'))
-                    value = identity.get('value', '')
-                    confidence = validate_confidence(identity.get('confidence', 0.9))
-                    
-                    normalized_value = validate_identity_value(value, kind)
-                    
-                    # Check for duplicates (per platform)
-                    existing = session.query(IdentityClaim).filter_by(
-                        principal_id=principal.id,
-                        platform=platform,
-                        normalized=normalized_value
-                    ).first()
-
-                    if existing:
-                        logger.warning("Duplicate identity claim skipped",
-                                     platform=platform, kind=kind, value=normalized_value)
-                        continue
-                    
-                    claim = IdentityClaim(
-                        principal_id=principal.id,
-                        platform=platform,
-                        kind=kind,
-                        value=value,
-                        normalized=normalized_value,
-                        confidence=confidence,
-                        first_seen=datetime.now(timezone.utc),
-                        last_seen=datetime.now(timezone.utc)
-                    )
-                    
-                    session.add(claim)
-                    created_identities.append({
-                        'kind': kind,
-                        'value': value,
-                        'normalized': normalized_value,
-                        'platform': platform,
-                        'confidence': confidence
-                    })
-                    
-                except ValidationError as e:
-                    logger.warning("Skipping invalid identity", error=str(e), identity=identity)
-                    continue
+        claim_rows = []
+        seen = set()
+        now = datetime.now(timezone.utc)
+        for identity in identities or []:
+            try:
+                kind = validate_identity_kind(identity.get('kind', ''))
+                platform = validate_platform(identity.get('platform', 'manual'))
+                value = identity.get('value', '')
+                confidence = validate_confidence(identity.get('confidence', 0.9))
+                
+                normalized_value = validate_identity_value(value, kind)
+            except ValidationError as e:
+                logger.warning("Skipping invalid identity", error=str(e), identity=identity)
+                continue
+            
+            if (platform, normalized_value) in seen:
+                logger.warning("Duplicate identity claim skipped",
+                             platform=platform, kind=kind, value=normalized_value)
+                continue
+            seen.add((platform, normalized_value))
+            
+            claim_rows.append({
+                'principal_id': principal.id,
+                'platform': platform,
+                'kind': kind,
+                'value': value,
+                'normalized': normalized_value,
+                'confidence': confidence,
+                'first_seen': now,
+                'last_seen': now
+            })
+            created_identities.append({
+                'kind': kind,
+                'value': value,
+                'normalized': normalized_value,
+                'platform': platform,
+                'confidence': confidence
+            })
+        
+        if claim_rows:
+            session.execute(insert(IdentityClaim), claim_rows)
         
         session.commit()
         
@@ -300,7 +299,8 @@ def add_contact_identity(
     kind: str,
     value: str,
     platform: str = 'manual',
-    confidence: float = 0.9
+    confidence: float = 0.9,
+    commit: bool = True
 ) -> Dict[str, Any]:
     """
     Add a new identity claim to an existing contact.
@@ -312,6 +312,9 @@ def add_contact_identity(
         value: Identity value
         platform: Platform source (default: 'manual')
         confidence: Confidence score (0.0-1.0)
+        commit: Commit the session once the claim is added. Pass False when
+            the caller batches several writes into its own transaction; the
+            claim is then written in a savepoint that alone is undone on failure
         
     Returns:
         Dictionary with success status and identity information
@@ -353,8 +356,12 @@ def add_contact_identity(
             last_seen=datetime.now(timezone.utc)
         )
         
-        session.add(claim)
-        session.commit()
+        if commit:
+            session.add(claim)
+            session.commit()
+        else:
+            with session.begin_nested():
+                session.add(claim)
         
         logger.info("Identity added to contact", 
                    contact_id=person_id,
@@ -378,11 +385,13 @@ def add_contact_identity(
         return {'success': False, 'error': f"Validation error: {str(e)}"}
     
     except IntegrityError as e:
-        session.rollback()
+        if commit:
+            session.rollback()
         return {'success': False, 'error': "Identity constraint violation"}
     
     except Exception as e:
-        session.rollback()
+        if commit:
+            session.rollback()
         logger.error("Unexpected error adding identity", error=str(e))
         return {'success': False, 'error': f"Failed to add identity: {str(e)}"}
 
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, ARRAY, Float
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, ARRAY, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -65,6 +65,12 @@ class PersonMessage(Base):
     message_id = Column(String, ForeignKey("message.id", ondelete="CASCADE"), primary_key=True)
     role = Column(Text, nullable=False, primary_key=True)  # 'sender'|'recipient'|'mentioned'|'quoted'
     confidence = Column(Float, default=1.0)
+
+    # The primary key leads with principal_id; loading a message's
+    # participants needs message_id first (see migrations/003)
+    __table_args__ = (
+        Index('person_message_message_idx', 'message_id'),
+    )
     
     # Relationships
     principal = relationship("Principal", back_populates="message_links")
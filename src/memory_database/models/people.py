@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy import Column, String, DateTime, Text, ARRAY, JSON, Float, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, DateTime, Text, ARRAY, JSON, Float, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -78,6 +78,8 @@ class IdentityClaim(Base):
     __table_args__ = (
         UniqueConstraint('principal_id', 'platform', 'normalized',
                         name='uq_identity_per_platform'),
+        # Cross-platform lookups by (kind, normalized); see migrations/003
+        Index('identity_claim_kind_normalized_idx', 'kind', 'normalized'),
     )
 
     # Relationships
@@ -97,7 +97,7 @@ class AttachmentManager:
             "duration": duration
         }
         
-        self.logger.info(
+        self.logger.debug(
             "Stored attachment",
             attachment_id=attachment_id,
             filename=source_path.name,
@@ -196,6 +196,27 @@ class AttachmentManager:
             )
             return False
     
+    def remove_attachment(self, stored_path: str) -> bool:
+        """
+        Delete a stored attachment, e.g. when its database row was never written.
+        
+        Args:
+            stored_path: Path to the stored attachment
+            
+        Returns:
+            True if the file was removed or was already gone
+        """
+        try:
+            Path(stored_path).unlink(missing_ok=True)
+            return True
+        except OSError as e:
+            self.logger.error(
+                "Failed to remove attachment",
+                path=stored_path,
+                error=str(e)
+            )
+            return False
+    
     def get_attachment_url(self, stored_path: str) -> str:
         """
         Get a file:// URL for the attachment.
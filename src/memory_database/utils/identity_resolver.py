@@ -10,13 +10,47 @@ from datetime import datetime, timezone
 import structlog
 
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, insert
+from sqlalchemy.dialects import postgresql, sqlite
 
 from memory_database.models import Principal, IdentityClaim
 from memory_database.utils.normalization import normalize_identity_value
 
 logger = structlog.get_logger()
 
+# Dialects whose INSERT supports ON CONFLICT ... DO UPDATE
+_UPSERT_INSERTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+# Columns of the uq_identity_per_platform constraint
+_CLAIM_KEY = ['principal_id', 'platform', 'normalized']
+# Columns an existing claim takes from a re-seen one
+_CLAIM_REFRESHED = ['value', 'kind', 'confidence', 'last_seen', 'extra']
+
+
+def upsert_identity_claims(session: Session, claim_rows: List[Dict[str, Any]]) -> None:
+    """
+    Write identity claim rows in one statement, refreshing claims that already exist.
+    
+    Rows conflicting on (principal_id, platform, normalized) update the existing
+    claim's value, kind, confidence, last_seen and extra; its id and first_seen
+    are kept. Dialects without ON CONFLICT support get a plain insert.
+    
+    Args:
+        session: Database session
+        claim_rows: identity_claim column dicts
+    """
+    table = IdentityClaim.__table__
+    dialect_insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+    if dialect_insert is None:
+        session.execute(insert(table), claim_rows)
+        return
+
+    stmt = dialect_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=_CLAIM_KEY,
+        set_={name: stmt.excluded[name] for name in _CLAIM_REFRESHED},
+    )
+    session.execute(stmt, claim_rows)
+
 
 def find_existing_principal(
     session: Session,
@@ -162,6 +196,8 @@ def link_or_create_principal(
     # Create identity claims for the new principal
     # Track (platform, normalized) combinations to avoid duplicates within the input list
     seen_combinations = set()
+    claim_rows = []
+    now = datetime.now(timezone.utc)
 
     for identity in identities:
         if not identity.get('value'):
@@ -185,35 +221,22 @@ def link_or_create_principal(
 
         seen_combinations.add(combination_key)
 
-        # Check if claim already exists in database (defensive)
-        # This shouldn't happen since we're creating a new principal, but check anyway
-        existing_claim = session.query(IdentityClaim).filter_by(
-            principal_id=principal.id,
-            platform=platform,
-            normalized=normalized
-        ).first()
-
-        if existing_claim:
-            # Update existing claim instead of creating duplicate
-            existing_claim.value = identity['value']
-            existing_claim.kind = identity.get('kind', 'unknown')
-            existing_claim.confidence = identity.get('confidence', 1.0)
-            existing_claim.last_seen = datetime.now(timezone.utc)
-            existing_claim.extra = identity.get('extra', {})
-        else:
-            # Create new identity claim
-            claim = IdentityClaim(
-                principal_id=principal.id,
-                platform=platform,
-                kind=identity.get('kind', 'unknown'),
-                value=identity['value'],
-                normalized=normalized,
-                confidence=identity.get('confidence', 1.0),
-                first_seen=datetime.now(timezone.utc),
-                last_seen=datetime.now(timezone.utc),
-                extra=identity.get('extra', {})
-            )
-            session.add(claim)
+        claim_rows.append({
+            'principal_id': principal.id,
+            'platform': platform,
+            'kind': identity.get('kind', 'unknown'),
+            'value': identity['value'],
+            'normalized': normalized,
+            'confidence': identity.get('confidence', 1.0),
+            'first_seen': now,
+            'last_seen': now,
+            'extra': identity.get('extra', {}),
+        })
+
+    if claim_rows:
+        # One statement instead of checking each claim first; a claim that
+        # already exists is refreshed rather than duplicated
+        upsert_identity_claims(session, claim_rows)
     
     logger.info(
         "Created new principal",
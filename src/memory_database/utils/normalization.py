@@ -7,6 +7,8 @@ across different data sources (contacts, iMessage, email, etc.).
 """
 
 import re
+from typing import Iterable, List, Optional
+
 import phonenumbers
 from phonenumbers import geocoder, carrier
 import structlog
@@ -14,6 +16,9 @@ from memory_database.utils.config import get_default_country
 
 INVALID_MEMORY_URL_CHARS = {"<", ">", '"', "|", "?"}
 
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
 logger = structlog.get_logger()
 
 # Default country for parsing phone numbers without country codes
@@ -193,7 +198,7 @@ def normalize_email(email: str) -> str:
             normalized = match.group(1).strip()
     
     # Validate basic email format
-    if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', normalized):
+    if not EMAIL_PATTERN.match(normalized):
         return ""
     
     return normalized
@@ -222,7 +227,7 @@ def normalize_name(name: str) -> str:
     normalized = name.lower()
     
     # Replace multiple spaces with single space
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = WHITESPACE_PATTERN.sub(' ', normalized)
     
     # Strip leading/trailing whitespace
     normalized = normalized.strip()
@@ -297,6 +302,37 @@ def normalize_identity_value(value: str, kind: str, default_country: str = DEFAU
         return value.lower().strip()
 
 
+def normalize_identity_values(
+    values: Iterable[Optional[str]], kind: str, default_country: str = DEFAULT_COUNTRY
+) -> List[str]:
+    """
+    Normalize a batch of values of one identity kind.
+    
+    Same results as calling normalize_identity_value on each value, but the
+    kind is routed once for the whole batch instead of once per value.
+    
+    Args:
+        values: Raw identity values (empty or None values normalize to "")
+        kind: Type of identity shared by all values
+        default_country: Country code for phone parsing (default: US)
+        
+    Returns:
+        Normalized values, in input order
+    """
+    if kind == 'phone':
+        return [normalize_phone(v, default_country) if v else "" for v in values]
+    if kind == 'email':
+        normalize = normalize_email
+    elif kind in ['display_name', 'name', 'alias']:
+        normalize = normalize_name
+    elif kind == 'memory_url':
+        normalize = normalize_memory_url
+    else:
+        # Usernames, IDs and everything else: lowercase and strip
+        return [v.lower().strip() if v else "" for v in values]
+    return [normalize(v) if v else "" for v in values]
+
+
 def extract_identity_kind(value: str) -> str:
     """
     Determine the kind of identity based on the value format.
@@ -316,9 +352,14 @@ def extract_identity_kind(value: str) -> str:
 
     # Check for email format
     if '@' in value and '.' in value:
-        if re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', value.strip()):
+        if EMAIL_PATTERN.match(value.strip()):
             return 'email'
     
+    # Phone numbers need at least one digit; skip the phonenumbers parse
+    # (the expensive part) for plain usernames
+    if not any(c.isdigit() for c in value):
+        return 'username'
+    
     # Check for phone format using phonenumbers
     # Try to parse as phone number
     try:
@@ -14,6 +14,7 @@ class MockAttachmentManager:
         self.base_path = base_path or Path("/tmp/mock_attachments")
         self.stored_attachments = {}
         self.storage_calls = []
+        self.removed_paths = []
     
     def store_attachment(
         self,
@@ -66,6 +67,14 @@ class MockAttachmentManager:
         
         return attachment_data
     
+    def remove_attachment(self, stored_path: str) -> bool:
+        """Mock removing a stored attachment."""
+        self.removed_paths.append(stored_path)
+        for attachment_id, att in list(self.stored_attachments.items()):
+            if att['stored_path'] == stored_path:
+                del self.stored_attachments[attachment_id]
+        return True
+    
     def _get_mock_mime_type(self, filename: str) -> str:
         """Get mock MIME type based on file extension."""
         ext = Path(filename).suffix.lower()
@@ -89,6 +98,7 @@ class MockAttachmentManager:
         """Clear all stored attachments (for test cleanup)."""
         self.stored_attachments.clear()
         self.storage_calls.clear()
+        self.removed_paths.clear()
     
     def get_storage_stats(self) -> Dict[str, int]:
         """Get statistics about stored attachments."""
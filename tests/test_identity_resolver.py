@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import ARRAY, create_engine, insert, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from src.models import Principal, IdentityClaim
+from src.utils.identity_resolver import upsert_identity_claims
+
+
+# Enough DDL to create the people tables on SQLite, which has ON CONFLICT too
+@compiles(JSONB, "sqlite")
+@compiles(ARRAY, "sqlite")
+def _as_sqlite_json(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    tables = [Principal.__table__, IdentityClaim.__table__]
+    Principal.metadata.create_all(engine, tables=tables)
+    with Session(engine) as session:
+        session.execute(
+            insert(Principal.__table__),
+            {'id': "p1", 'display_name': "Jane Doe", 'merged_from': None, 'extra': {}},
+        )
+        yield session
+
+
+def _claim(confidence: float, seen: datetime, **overrides):
+    row = {
+        'principal_id': "p1",
+        'platform': "imessage",
+        'kind': "email",
+        'value': "Jane@Example.com",
+        'normalized': "jane@example.com",
+        'confidence': confidence,
+        'first_seen': seen,
+        'last_seen': seen,
+        'extra': {},
+    }
+    row.update(overrides)
+    return row
+
+
+def test_upsert_identity_claims_refreshes_reseen_identity(session):
+    first_seen = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    seen_again = first_seen + timedelta(days=30)
+
+    upsert_identity_claims(session, [_claim(0.5, first_seen)])
+    original_id = session.scalar(select(IdentityClaim.__table__.c.id))
+
+    upsert_identity_claims(session, [
+        _claim(0.9, seen_again, value="jane@example.com"),
+        _claim(0.8, seen_again, platform="contacts"),
+    ])
+
+    claims = {
+        row.platform: row
+        for row in session.execute(select(IdentityClaim.__table__))
+    }
+    assert set(claims) == {"imessage", "contacts"}
+
+    reseen = claims["imessage"]
+    assert reseen.id == original_id
+    assert reseen.value == "jane@example.com"
+    assert reseen.confidence == 0.9
+    assert reseen.first_seen.replace(tzinfo=timezone.utc) == first_seen
+    assert reseen.last_seen.replace(tzinfo=timezone.utc) == seen_again
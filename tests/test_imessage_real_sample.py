@@ -329,6 +329,42 @@ class TestiMessageWithRealSample:
                         attachments = session.query(MessageAttachment).all()
                         assert len(attachments) > 0
     
+    def test_failed_batch_does_not_block_later_batches(self, test_db_manager, test_db_copy, mock_attachment_manager):
+        """Test that a batch whose insert fails is discarded and later batches still commit."""
+        flush_pending_rows = iMessageIncrementalPipeline._flush_pending_rows
+        batch_sizes = []
+        
+        def fail_first_batch(self, session, batch, msg_rows, *args):
+            batch_sizes.append(len(msg_rows))
+            if len(batch_sizes) == 1:
+                # A duplicate primary key makes the whole batch insert fail
+                msg_rows[1]['id'] = msg_rows[0]['id']
+            return flush_pending_rows(self, session, batch, msg_rows, *args)
+        
+        with patch('src.ingestion.imessage.AttachmentManager') as mock_am_class, \
+                patch.object(iMessageIncrementalPipeline, '_flush_pending_rows', fail_first_batch):
+            mock_am_class.return_value = mock_attachment_manager
+            
+            with patch('pathlib.Path.exists', return_value=True):
+                pipeline = iMessageIncrementalPipeline(test_db_manager, commit_batch_size=50)
+                
+                stats = pipeline.run_incremental_import(
+                    db_path=str(test_db_copy),
+                    limit=None,
+                    known_contacts_only=False
+                )
+        
+        assert len(batch_sizes) > 1
+        assert stats['new_messages'] == 200 - batch_sizes[0]
+        
+        with test_db_manager.get_session() as session:
+            assert session.query(Message).count() == stats['new_messages']
+            assert session.query(Channel).count() == 1
+            
+            # Only attachments of written batches are counted and kept
+            assert session.query(MessageAttachment).count() == stats['attachments_stored']
+            assert len(mock_attachment_manager.stored_attachments) == stats['attachments_stored']
+    
     def test_threading_and_channels(self, test_db_manager, test_db_copy, mock_attachment_manager):
         """Test that messages are properly organized into threads and channels."""
         
@@ -1,9 +1,12 @@
+from contextlib import contextmanager
 from types import SimpleNamespace
 from typing import List
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
-from src.ingestion.imessage import iMessageIngestionSource
+from src.ingestion.imessage import iMessageIngestionSource, iMessageIncrementalPipeline
+from tests.mocks.mock_attachment_manager import MockAttachmentManager
 
 
 class _DummyAttachmentManager:
@@ -93,3 +96,164 @@ def test_extract_raw_data_streams_in_batches(imessage_source):
 
     assert len(results) == 3
     assert fake_db.calls == [(0.0, 2), (2.0, 2)]
+
+
+class _BulkStreamingDB(_StreamingDB):
+    def __init__(self, messages: List[SimpleNamespace]):
+        super().__init__(messages)
+        self.bulk_calls: List[List[int]] = []
+
+    def get_messages_children(self, rowids: List[int]):
+        self.bulk_calls.append(list(rowids))
+        participants = {
+            1: [SimpleNamespace(rowid=7, id="+15551234567", service="iMessage", uncanonicalized_id=None)]
+        }
+        attachments = {
+            3: [SimpleNamespace(rowid=9, guid="att-1", filename="a.jpg", mime_type="image/jpeg",
+                                transfer_name="a.jpg", total_bytes=10)]
+        }
+        return participants, attachments
+
+    def get_message_participants(self, _rowid: int):
+        raise AssertionError("per-message participant lookup should not be used")
+
+    def get_message_attachments(self, _rowid: int):
+        raise AssertionError("per-message attachment lookup should not be used")
+
+
+def test_extract_raw_data_fetches_children_per_batch(imessage_source):
+    messages = [
+        _make_message(1, "g1", 1.0),
+        _make_message(2, "g2", 2.0),
+        _make_message(3, "g3", 3.0),
+    ]
+    fake_db = _BulkStreamingDB(messages)
+
+    imessage_source.batch_size = 2
+    imessage_source.imessage_db = fake_db
+
+    results = list(imessage_source.extract_raw_data("custom"))
+
+    assert fake_db.bulk_calls == [[1, 2], [3]]
+    assert results[0]['participants'] == [
+        {'rowid': 7, 'id': "+15551234567", 'service': "iMessage", 'uncanonicalized_id': None}
+    ]
+    assert results[1]['participants'] == [] and results[1]['attachments'] == []
+    assert [a['guid'] for a in results[2]['attachments']] == ["att-1"]
+
+
+def test_resolve_attachment_path_finds_guid_outside_expected_layout(imessage_source, tmp_path):
+    guid = "sms-1234"
+    attachment_dir = tmp_path / "zz" / "00" / guid
+    attachment_dir.mkdir(parents=True)
+    stored_file = attachment_dir / "clip.mov"
+    stored_file.write_text("data")
+
+    deep_guid = "sms-5678"
+    deep_dir = tmp_path / "ab" / "cd" / "ef" / deep_guid
+    deep_dir.mkdir(parents=True)
+    deep_file = deep_dir / "photo.heic"
+    deep_file.write_text("data")
+
+    assert imessage_source.resolve_attachment_path(guid, "clip.mov") == stored_file.resolve()
+    assert imessage_source.resolve_attachment_path(deep_guid, "photo.heic") == deep_file.resolve()
+    assert imessage_source.resolve_attachment_path(deep_guid) == deep_file.resolve()
+    assert imessage_source.resolve_attachment_path("missing-guid", "clip.mov") is None
+
+
+class _IteratingDB(_StreamingDB):
+    def __init__(self, messages: List[SimpleNamespace]):
+        super().__init__(messages)
+        self.iter_calls: List[tuple[float, int]] = []
+
+    def iter_messages_after(self, timestamp: float, batch_size: int):
+        self.iter_calls.append((timestamp, batch_size))
+        return iter(self.messages)
+
+
+def test_extract_raw_data_prefers_bridge_iterator(imessage_source):
+    # Two messages share a timestamp; timestamp pagination would drop one
+    messages = [
+        _make_message(1, "g1", 1.0),
+        _make_message(2, "g2", 2.0),
+        _make_message(3, "g3", 2.0),
+    ]
+    fake_db = _IteratingDB(messages)
+
+    imessage_source.batch_size = 2
+    imessage_source.imessage_db = fake_db
+
+    results = list(imessage_source.extract_raw_data("custom"))
+
+    assert [r['guid'] for r in results] == ["g1", "g2", "g3"]
+    assert fake_db.iter_calls == [(0.0, 2)]
+    assert fake_db.calls == []
+
+
+class _FailOnceSession:
+    """Session double whose first flush fails, as a duplicate thread insert would."""
+
+    def __init__(self):
+        self.failed = False
+        self.executed: List[tuple] = []
+
+    @contextmanager
+    def begin_nested(self):
+        yield
+
+    def flush(self):
+        if not self.failed:
+            self.failed = True
+            raise IntegrityError("INSERT INTO thread", {}, Exception("duplicate key"))
+
+    def execute(self, table, rows):
+        self.executed.append((table, len(rows)))
+
+
+def test_flush_pending_rows_discards_only_the_failed_batch(monkeypatch):
+    # Mappers are cleared between tests, so record the target table instead
+    monkeypatch.setattr("sqlalchemy.insert", lambda model: model.__tablename__)
+    pipeline = iMessageIncrementalPipeline(db_manager=None)
+    session = _FailOnceSession()
+    manager = MockAttachmentManager()
+    stats = {'new_messages': 2, 'attachments_stored': 0}
+
+    def buffer(n):
+        return (
+            [{'id': f"m{n}"}],
+            [{'principal_id': "p1", 'message_id': f"m{n}", 'role': "sender"}],
+            [{'id': f"a{n}", 'stored_path': f"/attachments/a{n}.jpg"}],
+        )
+
+    msg_rows, pm_rows, att_rows = buffer(1)
+    touched = {"p1"}
+    assert not pipeline._flush_pending_rows(
+        session, session.begin_nested(), msg_rows, pm_rows, att_rows, touched, stats, manager
+    )
+    assert msg_rows == pm_rows == att_rows == [] and touched == set()
+    assert manager.removed_paths == ["/attachments/a1.jpg"]
+    assert stats == {'new_messages': 1, 'attachments_stored': 0}
+
+    msg_rows, pm_rows, att_rows = buffer(2)
+    assert pipeline._flush_pending_rows(
+        session, session.begin_nested(), msg_rows, pm_rows, att_rows, touched, stats, manager
+    )
+    assert session.executed == [("message", 1), ("person_message", 1), ("message_attachment", 1)]
+    assert manager.removed_paths == ["/attachments/a1.jpg"]
+    assert stats == {'new_messages': 1, 'attachments_stored': 1}
+
+
+def test_discarded_batch_counts_only_written_principals():
+    stats = {'new_principals': 1, 'new_identities': 1, 'linked_principals': 2}
+    counted = dict.fromkeys(["p1", "p2", "p3"])
+    batch_start = iMessageIncrementalPipeline._batch_counts(stats, counted)
+
+    # The batch creates one principal and links another, then fails to write
+    counted["p4"] = counted["p5"] = None
+    stats['new_principals'] += 1
+    stats['new_identities'] += 1
+    stats['linked_principals'] += 1
+    iMessageIncrementalPipeline._discard_batch_counts(stats, counted, batch_start)
+
+    assert stats == {'new_principals': 1, 'new_identities': 1, 'linked_principals': 2}
+    assert list(counted) == ["p1", "p2", "p3"]
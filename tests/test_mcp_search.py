@@ -233,6 +233,49 @@ class TestMCPSearchQueries:
         # Should return at most 1 message
         assert len(messages) <= 1
     
+    def test_search_messages_for_person_with_before_cursor(self, session, sample_principals, sample_messages):
+        """Test paging back through messages, including ones sharing a sent_at."""
+        from src.models import Channel, Thread, Message, PersonMessage
+        
+        alice_id = find_person_by_any_identity(
+            session,
+            person_email="alice.johnson@techcorp.com"
+        )
+        
+        # Several messages at the same instant, so a page boundary falls inside the tie
+        channel = Channel(id="cursor-channel", platform="imessage", name="cursor")
+        thread = Thread(id="cursor-thread", channel_id=channel.id, subject="cursor")
+        session.add_all([channel, thread])
+        tied_at = datetime(2030, 1, 1, 12, 0, tzinfo=timezone.utc)
+        for i in range(5):
+            session.add(Message(id=f"cursor-msg-{i}", thread_id=thread.id, sent_at=tied_at, content=f"tie {i}"))
+            session.add(PersonMessage(principal_id=alice_id, message_id=f"cursor-msg-{i}", role="sender"))
+        session.flush()
+        
+        everything = [
+            msg['id']
+            for msg in search_messages_for_person(session, person_id=alice_id, limit=1000)
+        ]
+        assert len(everything) >= 5
+        
+        paged = []
+        before = before_id = None
+        while True:
+            page = search_messages_for_person(
+                session,
+                person_id=alice_id,
+                limit=2,
+                before=before,
+                before_id=before_id
+            )
+            paged.extend(msg['id'] for msg in page)
+            if len(page) < 2:
+                break
+            before, before_id = page[-1]['sent_at'], page[-1]['id']
+        
+        # Every message exactly once, in the same order as a single query
+        assert paged == everything
+    
     def test_search_messages_for_person_nonexistent(self, session, sample_principals, sample_messages):
         """Test searching messages for non-existent person."""
         messages = search_messages_for_person(
@@ -1,3 +1,4 @@
+import asyncio
 import importlib
 import os
 import sys
@@ -35,6 +36,16 @@ def ensure_dummy_server_module(monkeypatch):
     monkeypatch.setitem(sys.modules, module_name, dummy)
 
 
+@pytest.fixture(autouse=True)
+def clear_person_caches():
+    """Person lookups are memoized module-wide; don't let one test's fakes leak into another."""
+    from memory_database.mcp_server.person_cache import invalidate_person_caches
+
+    invalidate_person_caches()
+    yield
+    invalidate_person_caches()
+
+
 def import_photos_tools(monkeypatch):
     # Ensure environment variables required by DatabaseSettings are present if server accidentally loads
     monkeypatch.setenv("POSTGRES_HOST", os.getenv("POSTGRES_HOST", "localhost"))
@@ -293,7 +304,7 @@ def test_view_photos(tmp_path, monkeypatch):
     monkeypatch.setattr(mod, "PhotosDB", lambda: fake_db, raising=False)
 
     # Call view_photos
-    result = mod.view_photos(uuids=["v-1", "v-2"], use_preview=True)
+    result = asyncio.run(mod.view_photos(uuids=["v-1", "v-2"], use_preview=True))
 
     # Verify we got Image objects back
     assert isinstance(result, list)
@@ -315,7 +326,7 @@ def test_view_photos_returns_empty_on_error(monkeypatch):
     monkeypatch.setattr(mod, "PHOTOS_AVAILABLE", False, raising=False)
     monkeypatch.setattr(mod, "PHOTOS_IMPORT_ERROR", "osxphotos not installed", raising=False)
 
-    result = mod.view_photos(uuids=["test-uuid"])
+    result = asyncio.run(mod.view_photos(uuids=["test-uuid"]))
     assert result == []
 
 
@@ -358,3 +369,130 @@ def test_photos_search_single_day_inclusive_end_date(monkeypatch):
 
     assert to_dt.date() == dt.date(2025, 8, 23)
     assert to_dt.time() == dt.time.max
+
+
+def test_photos_search_date_index_matches_osxphotos_across_timezones(tmp_path, monkeypatch):
+    """The cached date index must select the same photos as osxphotos' from_date/to_date."""
+    import datetime as dt
+    import time
+
+    mod = import_photos_tools(monkeypatch)
+
+    library_path = tmp_path / "Photos Library.photoslibrary"
+    (library_path / "database").mkdir(parents=True)
+    (library_path / "database" / "Photos.sqlite").touch()
+
+    class DatedPhotosDB(FakePhotosDB):
+        """A real-looking library whose photos() filters like osxphotos does."""
+
+        def __init__(self, photos_list):
+            super().__init__(photos_list=photos_list)
+            self.library_path = str(library_path)
+
+        def photos(self, uuid=None, from_date=None, to_date=None, **_kwargs):
+            # osxphotos compares aware photo dates, taking naive bounds as local time
+            result = list(self._photos)
+            if uuid is not None:
+                result = [p for p in result if p.uuid in uuid]
+            if from_date is not None:
+                result = [p for p in result if p.date >= from_date.astimezone()]
+            if to_date is not None:
+                result = [p for p in result if p.date <= to_date.astimezone()]
+            return result
+
+    def photo(uuid, *args, hours):
+        taken = dt.datetime(*args, tzinfo=dt.timezone(dt.timedelta(hours=hours)))
+        return FakePhoto(uuid=uuid, date=taken, date_modified=taken)
+
+    old_tz = os.environ.get("TZ")
+    os.environ["TZ"] = "America/New_York"
+    time.tzset()
+    try:
+        photos = [
+            photo("ny-noon", 2024, 6, 1, 12, 0, hours=-4),
+            # June 2nd in Tokyo, still June 1st in New York
+            photo("tokyo-next-day", 2024, 6, 2, 1, 0, hours=9),
+            # June 1st in Paris, still May 31st in New York
+            photo("paris-early", 2024, 6, 1, 2, 0, hours=2),
+            # May 31st in Los Angeles, already June 1st in New York
+            photo("la-late", 2024, 5, 31, 22, 0, hours=-7),
+            photo("tokyo-evening", 2024, 6, 1, 23, 30, hours=9),
+            photo("ny-next-day", 2024, 6, 2, 0, 0, hours=-4),
+        ]
+        fake_db = DatedPhotosDB(photos)
+        monkeypatch.setattr(mod, "PHOTOS_AVAILABLE", True, raising=False)
+        monkeypatch.setattr(mod, "PhotosDB", lambda: fake_db, raising=False)
+        monkeypatch.setattr(mod, "_PHOTOS_LIBRARY", None, raising=False)
+
+        start = dt.datetime(2024, 6, 1)
+        end = dt.datetime.combine(dt.date(2024, 6, 1), dt.time.max)
+        expected = [p.uuid for p in fake_db.photos(from_date=start, to_date=end)]
+        assert expected == ["ny-noon", "tokyo-next-day", "la-late", "tokyo-evening"]
+
+        res = mod.photos_search(date_from="2024-06-01", date_to="2024-06-01", limit=10)
+        assert [p["uuid"] for p in res["photos"]] == expected
+        assert mod._PHOTOS_LIBRARY is not None and mod._PHOTOS_LIBRARY.mtime is not None
+
+        res = mod.photos_search(date_from="2024-06-01", date_to="2024-06-01", limit=2)
+        assert [p["uuid"] for p in res["photos"]] == expected[:2]
+    finally:
+        if old_tz is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = old_tz
+        time.tzset()
+
+
+def test_resolve_person_cached_skips_misses_and_invalidates(monkeypatch):
+    from memory_database.mcp_server.person_cache import invalidate_person_caches
+
+    mod = import_photos_tools(monkeypatch)
+
+    class FakeQuery:
+        def filter(self, *_args, **_kwargs):
+            return self
+
+        def first(self):
+            return None
+
+        def all(self):
+            return []
+
+    class FakeSession:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def query(self, _model):
+            return FakeQuery()
+
+    class FakeDBManager:
+        def get_session(self):
+            return FakeSession()
+
+    class FakePerson:
+        id = "P1"
+        display_name = "Alice Johnson"
+        identity_claims = []
+
+    class FakeIdentityClaim:
+        principal_id = platform = kind = None
+
+    found = {"person": None}
+    monkeypatch.setattr(mod, "db_manager", FakeDBManager(), raising=False)
+    monkeypatch.setattr(mod, "IdentityClaim", FakeIdentityClaim)
+    monkeypatch.setattr(mod, "resolve_person_selector", lambda _session, _selector: found["person"])
+    key = '{"email": "alice@example.com"}'
+
+    # Not found yet: the miss isn't remembered once the contact exists
+    assert mod._resolve_person_cached(key) is None
+    found["person"] = FakePerson()
+    assert mod._resolve_person_cached(key) == ("P1", "Alice Johnson", None, ("Alice Johnson",))
+
+    # Hits are reused until a contact write invalidates them
+    found["person"] = None
+    assert mod._resolve_person_cached(key) is not None
+    invalidate_person_caches()
+    assert mod._resolve_person_cached(key) is None